@@ -4,6 +4,8 @@ Configuration for Healthcare SLA CLI
 To find custom field IDs, look at a Jira ticket's JSON via:
   https://yourcompany.atlassian.net/rest/api/3/issue/ACS-123
 """
+import os
+from pathlib import Path
 
 # =============================================================================
 # JIRA CUSTOM FIELD IDS - UPDATE THESE
@@ -82,3 +84,20 @@ JIRA_FIELDS = {
     "source_of_identification": SOURCE_OF_ID_FIELD_ID,
     "config_done_date": CONFIG_DONE_DATE_FIELD_ID,
 }
+
+# Jira field display names — both front ends resolve these to IDs on the instance
+# (cached in FIELDS_CACHE_FILE) and fall back to JIRA_FIELDS when a name is
+# missing or ambiguous
+JIRA_FIELD_NAMES = {
+    "health_plan": "Health plan",
+    "category": "category",
+    "source_of_identification": "source of identification",
+    "config_done_date": "config done date",
+}
+
+# Local caches of Jira data. They can hold ticket contents, so they live in the
+# user's cache directory rather than the source tree
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "sla-app"
+FIELDS_CACHE_FILE = CACHE_DIR / "fields_cache.json"
+HTTP_CACHE_FILE = CACHE_DIR / "http_cache.json"
+ISSUE_CACHE_FILE = CACHE_DIR / "issue_cache.sqlite"
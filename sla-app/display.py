@@ -1,22 +1,149 @@
 """
 Terminal display using Rich library
 """
-from rich.console import Console
+import re
+from datetime import date
+from functools import lru_cache
+
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
 from rich.align import Align
 from rich.columns import Columns
+from rich.style import Style
+from rich.segment import Segment, Segments
+from rich.cells import cell_len
 from rich import box
+import numpy as np
 
 from sla_calculator import SLASummary, SLAResult
 
 
-console = Console()
-
-
-def display_sla_dashboard(summary: SLASummary):
-    """Display the SLA dashboard in the terminal."""
+_console: Console | None = None
+
+
+def get_console() -> Console:
+    """Shared Console, created on first use (construction probes the terminal)."""
+    global _console
+    if _console is None:
+        _console = Console()
+    return _console
+
+# Prebuilt cell styles — table cells are built as Text objects so Rich never
+# has to parse markup per cell
+MET_STYLE = Style(color="green")
+BREACH_STYLE = Style(color="red")
+BREACH_BOLD_STYLE = Style(color="red", bold=True)
+PROGRESS_STYLE = Style(color="yellow")
+DIM_STYLE = Style(dim=True)
+
+_MET_CELL = Text.assemble(("Met", MET_STYLE))
+_BREACHED_CELL = Text.assemble(("Breached", BREACH_STYLE))
+_IN_PROGRESS_CELL = Text.assemble(("In Progress", PROGRESS_STYLE))
+_EMPTY_CELL = Text.assemble(("--", DIM_STYLE))
+
+# Indexed by the status / elapsed levels display_sla_dashboard computes with np.where
+_STATUS_CELLS = (_MET_CELL, _BREACHED_CELL, _IN_PROGRESS_CELL)  # met, breached, in progress
+_DAYS_STYLES = (MET_STYLE, PROGRESS_STYLE, BREACH_BOLD_STYLE)     # on track, >80% of target, over
+
+_TICKET_NUM_RE = re.compile(r"-(\d+)$")
+
+# With --fast-render, ticket tables at least this long skip Rich's Table layout
+_FAST_RENDER_MIN_ROWS = 50
+
+# Description paragraph under each dashboard, keyed by a keyword of the SLA name
+# (checked in order — "Identification of Resolution" must match before "Resolution")
+_DESC_BY_KEYWORD = {
+    "First Response": (
+        "Showing all LA Blue ACS tickets measuring time from creation to the first "
+        "public comment (any author, including automations). "
+        "Elapsed = business days from ACS creation to first public comment (or to now if none yet)."
+    ),
+    "Identification": (
+        "Showing all LA Blue ACS tickets and their linked LPM tickets. "
+        "Tickets without an LPM link that are closed, resolved, or canceled are excluded. "
+        "Days = ACS creation → first time the linked LPM ticket reached 'Ready for Config' status "
+        "(or to today if not yet reached)."
+    ),
+    "Resolution": (
+        "Showing all LA Blue ACS tickets and their linked LPM tickets. "
+        "Tickets without an LPM link that are closed, resolved, or canceled are excluded. "
+        "Days = ACS creation → first time the linked LPM ticket reached 'Deployed to UAT', "
+        "'Waiting for Client UAT/Signoff', or 'Done' status (or to today if not yet reached)."
+    ),
+}
+
+
+def _ticket_num(result: SLAResult) -> int:
+    """Numeric part of the source ticket key (ACS-123 -> 123), 0 if there is none."""
+    m = _TICKET_NUM_RE.search(result.source_ticket)
+    return int(m.group(1)) if m else 0
+
+
+@lru_cache(maxsize=1024)
+def _fmt_date(d: date) -> str:
+    """Format a date as 'Jan 05, 2025'. Cached — most tickets share a few dozen distinct dates."""
+    return d.strftime("%b %d, %Y")
+
+
+def _description_for(sla_name: str) -> str:
+    """Description paragraph for an SLA dashboard, or "" if none applies."""
+    for keyword, desc_text in _DESC_BY_KEYWORD.items():
+        if keyword in sla_name:
+            return desc_text
+    return ""
+
+
+def _days_cell(result: SLAResult, days_style: Style) -> Text:
+    """Elapsed cell in the given style (see _DAYS_STYLES)."""
+    if result.elapsed_time_str:
+        return Text.assemble((result.elapsed_time_str, days_style))
+    return Text.assemble((str(result.days_elapsed), days_style), (f"/{result.target_days}", DIM_STYLE))
+
+
+def _render_ticket_table_fast(console: Console, columns: list, rows: list[tuple]) -> Segments:
+    """
+    Lay out ticket rows directly as Segments: one pass for column widths, then
+    one line per row. No wrapping or width fitting — meant for large tables,
+    where building and measuring a Rich Table dominates render time.
+    """
+    header_style = Style.parse("bold cyan")
+    row_styles = [Style.null(), DIM_STYLE]
+    col_styles = [Style.parse(c.style) if isinstance(c.style, str) else c.style for c in columns]
+    cells = [[console.render_str(c) if isinstance(c, str) else c for c in row] for row in rows]
+    widths = [
+        max([col.min_width or 0, cell_len(str(col.header))] + [row[i].cell_len for row in cells])
+        for i, col in enumerate(columns)
+    ]
+
+    segments = []
+
+    def emit_line(texts, styles, row_style):
+        for text, width, col, col_style in zip(texts, widths, columns, styles):
+            pad = width - text.cell_len
+            left = pad if col.justify == "right" else pad // 2 if col.justify == "center" else 0
+            base = row_style + col_style
+            segments.append(Segment(" " * (left + 1)))
+            for seg in text.render(console):
+                segments.append(Segment(seg.text, base + seg.style))
+            segments.append(Segment(" " * (pad - left + 1)))
+        segments.append(Segment.line())
+
+    emit_line([Text(str(c.header)) for c in columns], [header_style] * len(columns), Style.null())
+    segments.append(Segment("━" * (sum(widths) + 2 * len(widths)), DIM_STYLE))
+    segments.append(Segment.line())
+    for n, row in enumerate(cells):
+        emit_line(row, col_styles, row_styles[n % 2])
+    return Segments(segments)
+
+
+def display_sla_dashboard(summary: SLASummary, fast_render: bool = False):
+    """
+    Display the SLA dashboard in the terminal.
+    fast_render swaps the Rich Table for _render_ticket_table_fast on large tables.
+    """
+    console = get_console()
     term_width = console.size.width
 
     header = Panel(
@@ -27,21 +154,24 @@ def display_sla_dashboard(summary: SLASummary):
         padding=(1, 2),
         expand=True,
     )
-    console.print(header)
-    console.print()
+    # The whole dashboard is collected into one Group and printed in a single
+    # render pass; "" renders as a blank line
+    renderables = [header, ""]
 
-    resolved_count = summary.met_count + summary.breached_count
+    met_count = summary.met_count
+    breached_count = summary.breached_count
+    resolved_count = met_count + breached_count
     panel_width = max(12, (term_width - 10) // 4)
 
     met_panel = Panel(
-        Text(str(summary.met_count), justify="center", style="green bold"),
+        Text(str(met_count), justify="center", style="green bold"),
         title="[green]Met[/]",
         box=box.ROUNDED,
         border_style="green",
         width=panel_width,
     )
     breached_panel = Panel(
-        Text(str(summary.breached_count), justify="center", style="red bold"),
+        Text(str(breached_count), justify="center", style="red bold"),
         title="[red]Breached[/]",
         box=box.ROUNDED,
         border_style="red",
@@ -61,42 +191,20 @@ def display_sla_dashboard(summary: SLASummary):
         width=panel_width,
     )
 
-    console.print(Align.center(Columns([met_panel, breached_panel, progress_panel, total_panel], padding=(0, 1))))
+    renderables.append(Align.center(Columns([met_panel, breached_panel, progress_panel, total_panel], padding=(0, 1))))
 
     if resolved_count > 0:
-        rate = summary.compliance_rate
+        rate = met_count / resolved_count * 100
         rate_style = "green" if rate >= 90 else "yellow" if rate >= 75 else "red"
-        console.print(Align.center(
-            Text.from_markup(f"Compliance Rate: [{rate_style} bold]{rate:.1f}%[/]  [dim]({summary.met_count} of {resolved_count} resolved tickets met SLA)[/]")
+        renderables.append(Align.center(
+            Text.from_markup(f"Compliance Rate: [{rate_style} bold]{rate:.1f}%[/]  [dim]({met_count} of {resolved_count} resolved tickets met SLA)[/]")
         ))
 
-    console.print()
+    renderables.append("")
 
-    if "First Response" in summary.sla_name:
-        desc_text = (
-            "Showing all LA Blue ACS tickets measuring time from creation to the first "
-            "public comment (any author, including automations). "
-            "Elapsed = business days from ACS creation to first public comment (or to now if none yet)."
-        )
-    elif "Identification" in summary.sla_name:
-        desc_text = (
-            "Showing all LA Blue ACS tickets and their linked LPM tickets. "
-            "Tickets without an LPM link that are closed, resolved, or canceled are excluded. "
-            "Days = ACS creation → first time the linked LPM ticket reached 'Ready for Config' status "
-            "(or to today if not yet reached)."
-        )
-    elif "Resolution" in summary.sla_name:
-        desc_text = (
-            "Showing all LA Blue ACS tickets and their linked LPM tickets. "
-            "Tickets without an LPM link that are closed, resolved, or canceled are excluded. "
-            "Days = ACS creation → first time the linked LPM ticket reached 'Deployed to UAT', "
-            "'Waiting for Client UAT/Signoff', or 'Done' status (or to today if not yet reached)."
-        )
-    else:
-        desc_text = ""
-
-    console.print(Align.center(Text(desc_text, style="dim", justify="center"), width=min(term_width, 100)))
-    console.print()
+    desc_text = _description_for(summary.sla_name)
+    renderables.append(Align.center(Text(desc_text, style="dim", justify="center"), width=min(term_width, 100)))
+    renderables.append("")
 
     is_first_response = "First Response" in summary.sla_name
     is_resolution = "Resolution of" in summary.sla_name
@@ -128,73 +236,69 @@ def display_sla_dashboard(summary: SLASummary):
     ticket_table.add_column("Status", justify="center", no_wrap=True, min_width=11)
     ticket_table.add_column("Source of ID", style="dim", no_wrap=True)
 
-    def ticket_sort_key(r):
-        parts = r.source_ticket.rsplit("-", 1)
-        return int(parts[1]) if len(parts) == 2 and parts[1].isdigit() else 0
-
-    sorted_results = sorted(summary.results, key=ticket_sort_key, reverse=True)
+    # Classify and order every row with vectorized ops over summary.columns(),
+    # then index back into the result objects only for the cells themselves.
+    # A stable argsort on the negated ticket numbers matches sorted(..., reverse=True).
+    results = summary.results
+    cols = summary.columns()
+    ticket_nums = np.fromiter((_ticket_num(r) for r in results), dtype=np.int64, count=len(results))
+    order = np.argsort(-ticket_nums, kind="stable").tolist()
+    days, target_days = cols["days_elapsed"], cols["target_days"]
+    days_level = np.where(days > target_days, 2, np.where(days > target_days * 0.8, 1, 0)).tolist()
+    status_level = np.where(cols["is_met"], 0, np.where(cols["is_breached"], 1, 2)).tolist()
 
     datetime_fmt = "%b %d, %Y %I:%M %p"
-    date_fmt = "%b %d, %Y"
 
-    for i, result in enumerate(sorted_results, 1):
-        if result.is_met:
-            status = "[green]Met[/]"
-        elif result.is_breached:
-            status = "[red]Breached[/]"
-        else:
-            status = "[yellow]In Progress[/]"
-
-        if result.elapsed_time_str:
-            if result.days_elapsed > result.target_days:
-                days_str = f"[red bold]{result.elapsed_time_str}[/]"
-            elif result.days_elapsed > result.target_days * 0.8:
-                days_str = f"[yellow]{result.elapsed_time_str}[/]"
-            else:
-                days_str = f"[green]{result.elapsed_time_str}[/]"
-        elif result.days_elapsed > result.target_days:
-            days_str = f"[red bold]{result.days_elapsed}[/][dim]/{result.target_days}[/]"
-        elif result.days_elapsed > result.target_days * 0.8:
-            days_str = f"[yellow]{result.days_elapsed}[/][dim]/{result.target_days}[/]"
-        else:
-            days_str = f"[green]{result.days_elapsed}[/][dim]/{result.target_days}[/]"
+    sorted_results = [results[k] for k in order]
+    status_cells = [_STATUS_CELLS[status_level[k]] for k in order]
+    days_cells = [_days_cell(results[k], _DAYS_STYLES[days_level[k]]) for k in order]
 
+    rows = []
+    for i, (result, status, days_str) in enumerate(zip(sorted_results, status_cells, days_cells), 1):
         if is_first_response:
             acs_created = result.created_date.strftime(datetime_fmt) if result.created_date else "--"
-            comment_date = result.resolved_date.strftime(datetime_fmt) if result.resolved_date else "[dim]--[/]"
-            ticket_table.add_row(
+            comment_date = result.resolved_date.strftime(datetime_fmt) if result.resolved_date else _EMPTY_CELL
+            rows.append((
                 str(i),
                 result.source_ticket,
-                result.category_migrated or "[dim]--[/]",
+                result.category_migrated or _EMPTY_CELL,
                 acs_created,
                 comment_date,
                 days_str,
                 status,
-                result.source_of_identification or "[dim]--[/]",
-            )
+                result.source_of_identification or _EMPTY_CELL,
+            ))
         else:
-            target = result.target_ticket or "[dim]--[/]"
-            acs_created = result.created_date.strftime(date_fmt) if result.created_date else "--"
-            lpm_date = result.resolved_date.strftime(date_fmt) if result.resolved_date else "[dim]--[/]"
-            ticket_table.add_row(
+            target = result.target_ticket or _EMPTY_CELL
+            acs_created = _fmt_date(result.created_date.date()) if result.created_date else "--"
+            lpm_date = _fmt_date(result.resolved_date.date()) if result.resolved_date else _EMPTY_CELL
+            rows.append((
                 str(i),
                 result.source_ticket,
-                result.category_migrated or "[dim]--[/]",
+                result.category_migrated or _EMPTY_CELL,
                 acs_created,
                 target,
-                result.lpm_category or "[dim]--[/]",
+                result.lpm_category or _EMPTY_CELL,
                 lpm_date,
                 days_str,
                 status,
-                result.source_of_identification or "[dim]--[/]",
-            )
+                result.source_of_identification or _EMPTY_CELL,
+            ))
 
-    console.print(ticket_table)
-    console.print()
+    if fast_render and len(rows) >= _FAST_RENDER_MIN_ROWS:
+        table_renderable = _render_ticket_table_fast(console, ticket_table.columns, rows)
+    else:
+        for row in rows:
+            ticket_table.add_row(*row)
+        table_renderable = ticket_table
+
+    renderables.extend([table_renderable, ""])
+    console.print(Group(*renderables))
 
 
 def display_fix_version_tickets(version_data: list[dict]):
     """Display LPM fix version tickets with linked keys when no SR sub-tasks are found."""
+    console = get_console()
     console.print(Panel(
         Text(
             "No SR sub-tasks found linked to any LPM tickets.\n"
@@ -262,6 +366,7 @@ def display_fix_version_tickets(version_data: list[dict]):
 
 def display_error(message: str):
     """Display an error message."""
+    console = get_console()
     console.print(Panel(
         Text(message, style="red"),
         title="Error",
@@ -272,9 +377,11 @@ def display_error(message: str):
 
 def display_info(message: str):
     """Display an info message."""
+    console = get_console()
     console.print(f"[cyan]i[/] {message}")
 
 
 def display_success(message: str):
     """Display a success message."""
+    console = get_console()
     console.print(f"[green]v[/] {message}")
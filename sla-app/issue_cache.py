@@ -0,0 +1,97 @@
+"""
+On-disk Jira issue cache for Healthcare SLA CLI
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+_log = logging.getLogger(__name__)
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Rows not seen by any run for this long are dropped when the cache is opened
+_MAX_AGE_SECONDS = 30 * 24 * 3600
+
+
+def prepare_private_file(path: Path):
+    """
+    Create path's directory (mode 0700) and path itself (mode 0600) if missing, and
+    tighten both if an earlier run left them readable by other users. The local
+    caches hold Jira ticket contents, so only the owner may read them.
+    """
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    os.chmod(path.parent, 0o700)
+    os.close(os.open(path, os.O_WRONLY | os.O_CREAT, 0o600))
+    os.chmod(path, 0o600)
+
+
+class IssueCache:
+    """
+    SQLite store of issue payloads, each tagged with the issue's "updated" value.
+
+    A cached payload is only reused while Jira still reports the same "updated"
+    timestamp for the issue, so callers list (key, updated) pairs cheaply and
+    fetch full payloads only for new or changed issues. Entries are scoped (by
+    instance and requested fields/expand), since a payload only holds what was
+    asked for.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        prepare_private_file(path)  # SQLite creates its -wal/-shm files with the same mode
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS issues ("
+            " scope TEXT NOT NULL, key TEXT NOT NULL, updated TEXT, payload TEXT NOT NULL,"
+            " seen_at INTEGER NOT NULL, PRIMARY KEY (scope, key))"
+        )
+        self._conn.execute("DELETE FROM issues WHERE seen_at < ?", (int(time.time()) - _MAX_AGE_SECONDS,))
+        self._conn.commit()
+
+    def get_many(self, scope: str, keys: list[str], max_age: int = None) -> dict:
+        """
+        Return {key: (updated, payload)} for the keys cached under scope. With max_age,
+        only entries stored or touched within the last max_age seconds are returned.
+        """
+        found = {}
+        oldest = int(time.time()) - max_age if max_age is not None else 0
+        with self._lock:
+            for i in range(0, len(keys), 500):  # stay under SQLite's bound-parameter limit
+                batch = keys[i:i + 500]
+                rows = self._conn.execute(
+                    f"SELECT key, updated, payload FROM issues WHERE scope = ? AND seen_at >= ?"
+                    f" AND key IN ({','.join('?' * len(batch))})",
+                    (scope, oldest, *batch),
+                ).fetchall()
+                found.update((key, (updated, payload)) for key, updated, payload in rows)
+        return {key: (updated, _json_loads(payload)) for key, (updated, payload) in found.items()}
+
+    def touch(self, scope: str, keys: list[str]):
+        """Mark keys as seen by this run, so unchanged entries are not aged out."""
+        now = int(time.time())
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE issues SET seen_at = ? WHERE scope = ? AND key = ?",
+                [(now, scope, key) for key in keys],
+            )
+
+    def put_many(self, scope: str, entries: list[tuple]):
+        """Store (key, updated, payload) entries under scope, replacing older copies."""
+        now = int(time.time())
+        rows = [(scope, key, updated, json.dumps(payload), now) for key, updated, payload in entries]
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO issues VALUES (?, ?, ?, ?, ?)", rows)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -1,15 +1,52 @@
 """
 Jira API Client for Healthcare SLA CLI
 """
+import json
 import logging
+import sqlite3
+import threading
 import time
 import requests
 from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 from typing import Optional
+from urllib.parse import urlencode
+
+from issue_cache import IssueCache, prepare_private_file
 
 _log = logging.getLogger(__name__)
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import ijson
+    from ijson.common import ObjectBuilder
+except ImportError:
+    ijson = None
+
+# GET endpoints whose responses the ETag cache keeps: issue changelog and comment
+# pages, the bulky per-issue reads that repeat unchanged between runs
+_HTTP_CACHED_SUFFIXES = ("/changelog", "/comment")
+
+# Concurrent page requests per paginated fetch
+_PAGE_WORKERS = 8
+
+# Pooled connections per host. Callers fan out up to 8 requests at once and each paged
+# fetch fans out _PAGE_WORKERS more; connections beyond the pool are closed after use,
+# so a pool smaller than that pays a fresh TLS handshake for the overflow
+_POOL_SIZE = 64
+
+# Fields requested by search_issues when the caller does not name any
+_DEFAULT_SEARCH_FIELDS = ["summary", "status", "created"]
+
 
 def _resolve_base_url(instance_url: str, token: str) -> str:
     """
@@ -23,7 +60,7 @@ def _resolve_base_url(instance_url: str, token: str) -> str:
     try:
         resp = requests.get(f"{instance_url}/_edge/tenant_info", timeout=10)
         resp.raise_for_status()
-        cloud_id = resp.json().get("cloudId")
+        cloud_id = _json_loads(resp.content).get("cloudId")
         if cloud_id:
             gateway = f"https://api.atlassian.com/ex/jira/{cloud_id}"
             _log.info("Resolved cloud ID: %s → using gateway URL: %s", cloud_id, gateway)
@@ -33,8 +70,37 @@ def _resolve_base_url(instance_url: str, token: str) -> str:
     return instance_url
 
 
+def fold_statuses(target_status) -> frozenset:
+    """Casefolded set of a status name or list of names, as find_status_transition_date matches them."""
+    if isinstance(target_status, str):
+        return frozenset((target_status.casefold(),))
+    return frozenset(s.casefold() for s in target_status)
+
+
+def find_status_transition_date(changelog: list[dict], target_status) -> Optional[str]:
+    """
+    Return the date an issue first transitioned to a given status (or any status
+    in a list), scanning already-fetched changelog entries in chronological order.
+    A frozenset is taken as already folded by fold_statuses, so callers matching
+    many changelogs against the same targets fold them once.
+    """
+    target_statuses = target_status if isinstance(target_status, frozenset) else fold_statuses(target_status)
+
+    # next() stops at the first matching transition
+    return next(
+        (
+            entry.get("created")
+            for entry in changelog
+            for item in entry.get("items", ())
+            if item.get("field") == "status" and (item.get("toString") or "").casefold() in target_statuses
+        ),
+        None,
+    )
+
+
 class JiraClient:
-    def __init__(self, base_url: str, email: str, token: str, use_gateway: bool = True):
+    def __init__(self, base_url: str, email: str, token: str, use_gateway: bool = True,
+                 http_cache_file: Path = None, issue_cache_file: Path = None):
         """
         Args:
             base_url:    Your Jira instance URL (e.g. https://yourcompany.atlassian.net).
@@ -42,6 +108,12 @@ class JiraClient:
             token:       API token (personal or scoped service account token).
             use_gateway: If True (default), automatically resolve the Atlassian API gateway
                          URL using the cloud ID. Set to False to use the instance URL directly.
+            http_cache_file: Optional JSON file of ETags and bodies from earlier runs. GET
+                         requests revalidate against it with If-None-Match; call
+                         save_http_cache() to write it back.
+            issue_cache_file: Optional SQLite file of issues from earlier runs.
+                         search_issues_with_changelog only refetches issues whose
+                         "updated" timestamp has changed since they were cached.
         """
         if not all([base_url, email, token]):
             raise ValueError(
@@ -61,61 +133,306 @@ class JiraClient:
             "Content-Type": "application/json",
         }
 
+        self._fields_by_name: Optional[dict] = None
+
+        # ETag cache: {url: {"etag": ..., "body": raw response text}}. Only entries
+        # used during this run are written back, so the file does not grow forever.
+        self._http_cache_file = http_cache_file
+        self._http_cache: dict = {}
+        self._http_cache_used: dict = {}
+        self._http_cache_lock = threading.Lock()
+        if http_cache_file and http_cache_file.exists():
+            try:
+                self._http_cache = json.loads(http_cache_file.read_text())
+            except Exception:
+                self._http_cache = {}
+
+        self._issue_cache: Optional[IssueCache] = None
+        if issue_cache_file:
+            try:
+                self._issue_cache = IssueCache(issue_cache_file)
+            except (sqlite3.Error, OSError) as e:
+                _log.warning("Could not open issue cache %s: %s", issue_cache_file, e)
+
+        # Pooled session so TCP/TLS connections are reused across calls and worker threads.
+        # The adapter retries transient 5xx responses before raise_for_status sees them; 429 is
+        # left to the request methods' own Retry-After loops, so it is retried in one place only.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=["GET", "POST"],  # POST is only used for read-only JQL search
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_maxsize=_POOL_SIZE, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
     def _make_request(self, endpoint: str, params: dict = None, _retries: int = 5) -> dict:
-        """Make a GET request to Jira API with retry/backoff on rate limits."""
+        """
+        Make a GET request to Jira API with retry/backoff on rate limits.
+        With an HTTP cache, changelog and comment pages (_HTTP_CACHED_SUFFIXES) are
+        sent with their ETag, and a 304 Not Modified reply is answered from the cached body.
+        """
         url = f"{self.base_url}{endpoint}"
+        cache_key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+        cacheable = bool(self._http_cache_file) and endpoint.endswith(_HTTP_CACHED_SUFFIXES)
+        cached = self._http_cache.get(cache_key) if cacheable else None
+        headers = {"If-None-Match": cached["etag"]} if cached else None
         for attempt in range(_retries):
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self.session.get(url, params=params, headers=headers)
             if response.status_code == 429:
                 retry_after = int(response.headers.get("Retry-After", 2 ** attempt))
                 time.sleep(retry_after)
                 continue
+            if response.status_code == 304 and cached:
+                with self._http_cache_lock:
+                    self._http_cache_used[cache_key] = cached
+                return _json_loads(cached["body"])
             response.raise_for_status()
-            return response.json()
+            etag = response.headers.get("ETag")
+            if cacheable and etag:
+                with self._http_cache_lock:
+                    self._http_cache_used[cache_key] = {"etag": etag, "body": response.text}
+            return _json_loads(response.content)
         response.raise_for_status()  # raise after exhausting retries
 
     def _post_request(self, endpoint: str, body: dict, _retries: int = 5) -> dict:
         """Make a POST request to Jira API with retry/backoff on rate limits."""
         url = f"{self.base_url}{endpoint}"
         for attempt in range(_retries):
-            response = requests.post(url, headers=self.headers, json=body)
+            response = self.session.post(url, json=body)
             if response.status_code == 429:
                 retry_after = int(response.headers.get("Retry-After", 2 ** attempt))
                 time.sleep(retry_after)
                 continue
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
         response.raise_for_status()  # raise after exhausting retries
 
-    def search_issues(self, jql: str, fields: list[str] = None, max_results: int = 100) -> list[dict]:
-        """Search for issues using JQL, paging through all results via nextPageToken."""
-        all_issues = []
+    def _post_request_stream(self, endpoint: str, body: dict, _retries: int = 5) -> requests.Response:
+        """Like _post_request, but return the open response for incremental parsing."""
+        url = f"{self.base_url}{endpoint}"
+        for attempt in range(_retries):
+            response = self.session.post(url, json=body, stream=True)
+            if response.status_code == 429:
+                retry_after = int(response.headers.get("Retry-After", 2 ** attempt))
+                response.close()
+                time.sleep(retry_after)
+                continue
+            try:
+                response.raise_for_status()
+            except Exception:
+                # Nobody else will read this stream: release its pooled connection now, not at GC
+                # (a 400 is expected when a status filter names a status that no longer exists)
+                response.close()
+                raise
+            # Let urllib3 undo gzip/deflate so ijson sees plain JSON
+            response.raw.decode_content = True
+            return response
+        response.close()
+        response.raise_for_status()  # raise after exhausting retries
+
+    def _get_all_pages(self, endpoint: str, items_key: str, page_size: int = 100) -> list[dict]:
+        """
+        Fetch every page of a startAt/total paginated endpoint.
+
+        The first page tells us the total, so the remaining pages are requested
+        concurrently instead of one after another. Results keep Jira's order.
+        """
+        data = self._make_request(endpoint, params={"startAt": 0, "maxResults": page_size})
+        items = data.get(items_key, [])
+        total = data.get("total", 0)
+        # Jira may cap the page below what we asked for — step by what it actually returned
+        step = len(items)
+        if not step or step >= total:
+            return items
+
+        offsets = range(step, total, step)
+        with ThreadPoolExecutor(max_workers=min(_PAGE_WORKERS, len(offsets))) as pool:
+            pages = pool.map(
+                lambda start_at: self._make_request(endpoint, params={"startAt": start_at, "maxResults": step}),
+                offsets,
+            )
+            for page in pages:
+                items.extend(page.get(items_key, []))
+        return items
+
+    def search_issues(self, jql: str, fields: list[str] = None, max_results: int = 1000, expand: str = None,
+                      cached: bool = False) -> list[dict]:
+        """
+        Search for issues using JQL, paging through all results via nextPageToken.
+
+        max_results is only an upper bound — Jira caps the page size itself
+        (lower when many fields are requested), so asking for a large page is
+        safe and keeps the number of round-trips down.
+
+        Without an explicit fields list only _DEFAULT_SEARCH_FIELDS are requested;
+        Jira's own default returns every navigable field, which is mostly waste.
+
+        With cached and an issue cache, unchanged issues are reused from an earlier
+        run (see _search_cached). Only pass it for fields whose changes bump the
+        issue's "updated" — not e.g. issuelinks, which embed the linked issue's status.
+        """
+        if cached and not expand and self._issue_cache is not None:
+            return self._search_cached(
+                jql, fields, "search",
+                lambda q: list(self.iter_issues(q, fields=fields, max_results=max_results)),
+            )
+        return list(self.iter_issues(jql, fields=fields, max_results=max_results, expand=expand))
+
+    def iter_issues(self, jql: str, fields: list[str] = None, max_results: int = 1000, expand: str = None):
+        """
+        Generator form of search_issues: yields matching issues one at a time.
+
+        With ijson installed each page is parsed as it streams in, so only one
+        issue is held in memory at a time and no further pages are requested
+        if the caller stops iterating.
+        """
+        if fields is None:
+            fields = _DEFAULT_SEARCH_FIELDS
         next_page_token = None
 
         while True:
             body = {"jql": jql, "maxResults": max_results}
             if fields:
                 body["fields"] = [f for f in fields if f]  # strip empty field IDs
+            if expand:
+                body["expand"] = expand
             if next_page_token:
                 body["nextPageToken"] = next_page_token
 
+            count, next_page_token = yield from self._search_page(body)
+
+            if not count or not next_page_token:
+                break
+            if count < max_results:
+                # Server capped the page — ask for what it will actually return
+                _log.debug("Jira returned %d of %d requested issues per page — using its page size", count, max_results)
+                max_results = count
+
+    def _search_page(self, body: dict):
+        """Yield the issues of one search page, then return (issue count, nextPageToken)."""
+        if ijson is None:
             data = self._post_request("/rest/api/3/search/jql", body)
             issues = data.get("issues", [])
-            all_issues.extend(issues)
+            yield from issues
+            return len(issues), data.get("nextPageToken")
 
-            next_page_token = data.get("nextPageToken")
-            if not issues or not next_page_token:
-                break
+        count = 0
+        next_page_token = None
+        builder = None
+        with self._post_request_stream("/rest/api/3/search/jql", body) as response:
+            for prefix, event, value in ijson.parse(response.raw, use_float=True):
+                if builder is not None:
+                    builder.event(event, value)
+                    if prefix == "issues.item" and event == "end_map":
+                        count += 1
+                        yield builder.value
+                        builder = None
+                elif prefix == "issues.item" and event == "start_map":
+                    builder = ObjectBuilder()
+                    builder.event(event, value)
+                elif prefix == "nextPageToken":
+                    next_page_token = value
+        return count, next_page_token
+
+    def search_issues_with_changelog(self, jql: str, fields: list[str] = None) -> list[dict]:
+        """
+        Search for issues with their changelogs included (expand=changelog).
+
+        Each issue's changelog["histories"] is returned in chronological order.
+        Jira only inlines the most recent histories, so issues whose changelog
+        was truncated have the full changelog fetched separately.
+
+        With an issue cache, unchanged issues are reused from an earlier run
+        (see _search_cached; any new changelog entry bumps "updated").
+        """
+        if self._issue_cache is None:
+            return self._fetch_with_changelog(jql, fields)
+        return self._search_cached(jql, fields, "changelog", lambda q: self._fetch_with_changelog(q, fields))
+
+    def _search_cached(self, jql: str, fields: list[str], kind: str, fetch) -> list[dict]:
+        """
+        Run a search through the issue cache: list only each match's "updated"
+        timestamp, then call fetch("key in (...)") just for the issues that are new
+        or changed since they were cached. Entries are scoped by kind and fields.
+        """
+        scope = f"{self.base_url}|{kind}|{','.join(sorted(f for f in fields or _DEFAULT_SEARCH_FIELDS if f))}"
+        listed = {issue["key"]: issue.get("fields", {}).get("updated") for issue in self.iter_issues(jql, fields=["updated"])}
+        try:
+            cached = self._issue_cache.get_many(scope, list(listed))
+        except sqlite3.Error as e:
+            _log.warning("Issue cache read failed: %s", e)
+            cached = {}
+
+        stale = [key for key, updated in listed.items() if updated is None or cached.get(key, (None,))[0] != updated]
+        fetched = {}
+        for i in range(0, len(stale), 100):
+            batch = stale[i:i + 100]
+            for issue in fetch(f'key in ({", ".join(batch)})'):
+                fetched[issue["key"]] = issue
+
+        try:
+            self._issue_cache.touch(scope, [key for key in listed if key not in fetched])
+            self._issue_cache.put_many(scope, [(key, listed.get(key), issue) for key, issue in fetched.items()])
+        except sqlite3.Error as e:
+            _log.warning("Issue cache write failed: %s", e)
+        _log.info("Issue cache: %d of %d issues unchanged since the last run", len(listed) - len(stale), len(listed))
+
+        stale = set(stale)
+        return [
+            fetched[key] if key in fetched else cached[key][1]
+            for key in listed
+            if key in fetched or key not in stale
+        ]
+
+    def _fetch_with_changelog(self, jql: str, fields: list[str] = None) -> list[dict]:
+        """search_issues with expand=changelog, completing truncated changelogs."""
+        issues = self.search_issues(jql, fields=fields, expand="changelog")
+        for issue in issues:
+            changelog = issue.setdefault("changelog", {})
+            histories = changelog.get("histories", [])
+            if changelog.get("total", 0) > len(histories):
+                histories = self.get_issue_changelog(issue["key"])
+            else:
+                histories = sorted(histories, key=lambda h: h.get("created") or "")
+            changelog["histories"] = histories
+        return issues
 
-        return all_issues
+    def get_issue(self, issue_key: str, fields: list[str] = None, max_age: int = None) -> dict:
+        """
+        Get a single issue by key.
+
+        With max_age (seconds) and an issue cache, a copy fetched by an earlier run
+        within that window is returned without a request. Only pass it for fields
+        that may be up to max_age out of date.
+        """
+        scope = None
+        if max_age is not None and self._issue_cache is not None:
+            scope = f"{self.base_url}|issue|{','.join(sorted(fields or ()))}"
+            try:
+                cached = self._issue_cache.get_many(scope, [issue_key], max_age=max_age)
+            except sqlite3.Error as e:
+                _log.warning("Issue cache read failed: %s", e)
+                cached = {}
+            if issue_key in cached:
+                return cached[issue_key][1]
 
-    def get_issue(self, issue_key: str, fields: list[str] = None) -> dict:
-        """Get a single issue by key."""
         endpoint = f"/rest/api/3/issue/{issue_key}"
         params = {}
         if fields:
             params["fields"] = ",".join(fields)
-        return self._make_request(endpoint, params)
+        issue = self._make_request(endpoint, params)
+
+        if scope is not None:
+            try:
+                self._issue_cache.put_many(scope, [(issue_key, issue.get("fields", {}).get("updated"), issue)])
+            except sqlite3.Error as e:
+                _log.warning("Issue cache write failed: %s", e)
+        return issue
 
     def get_issue_links(self, issue_key: str) -> list[dict]:
         """Get all links for an issue."""
@@ -124,45 +441,77 @@ class JiraClient:
 
     def get_issue_changelog(self, issue_key: str) -> list[dict]:
         """Get all changelog entries for an issue, paging through all results."""
-        endpoint = f"/rest/api/3/issue/{issue_key}/changelog"
-        all_values = []
-        start_at = 0
-        while True:
-            data = self._make_request(endpoint, params={"startAt": start_at, "maxResults": 100})
-            values = data.get("values", [])
-            all_values.extend(values)
-            start_at += len(values)
-            if start_at >= data.get("total", 0) or not values:
-                break
-        return all_values
-
-    def get_status_transition_date(self, issue_key: str, target_status) -> Optional[str]:
-        """Find the date when an issue first transitioned to a given status (or any status in a list)."""
-        if isinstance(target_status, str):
-            target_statuses = {target_status.lower()}
-        else:
-            target_statuses = {s.lower() for s in target_status}
-
-        changelog = self.get_issue_changelog(issue_key)
-        for entry in changelog:
-            for item in entry.get("items", []):
-                if item.get("field") == "status" and (item.get("toString") or "").lower() in target_statuses:
-                    return entry.get("created")
-        return None
+        return self._get_all_pages(f"/rest/api/3/issue/{issue_key}/changelog", "values")
+
+    def get_status_transition_date(self, issue_key: str, target_status, changelog: list[dict] = None) -> Optional[str]:
+        """
+        Find the date when an issue first transitioned to a given status (or any status in a list).
+        Pass an already-fetched changelog to skip the changelog request.
+        """
+        if changelog is None:
+            changelog = self.get_issue_changelog(issue_key)
+        return find_status_transition_date(changelog, target_status)
 
     def get_issue_comments(self, issue_key: str) -> list[dict]:
         """Get all comments for an issue, paging through all results."""
-        endpoint = f"/rest/api/3/issue/{issue_key}/comment"
-        all_comments = []
-        start_at = 0
-        while True:
-            data = self._make_request(endpoint, params={"startAt": start_at, "maxResults": 100})
-            comments = data.get("comments", [])
-            all_comments.extend(comments)
-            start_at += len(comments)
-            if start_at >= data.get("total", 0) or not comments:
-                break
-        return all_comments
+        return self._get_all_pages(f"/rest/api/3/issue/{issue_key}/comment", "comments")
+
+    def get_fields_by_name(self, cache_file: Path = None, ttl_seconds: int = 24 * 3600) -> dict:
+        """
+        Return {lowercased field name: field ID} for every field on the instance.
+
+        /rest/api/3/field is requested at most once per client. With cache_file,
+        the mapping is also persisted (keyed on base_url) and reused by later runs
+        until ttl_seconds have passed. Names shared by several fields map to None.
+        """
+        if self._fields_by_name is not None:
+            return self._fields_by_name
+
+        cache = {}
+        if cache_file and cache_file.exists():
+            try:
+                cache = json.loads(cache_file.read_text())
+            except Exception:
+                cache = {}
+        entry = cache.get(self.base_url)
+        if entry and time.time() - entry.get("fetched_at", 0) < ttl_seconds:
+            self._fields_by_name = entry["fields"]
+            return self._fields_by_name
+
+        by_name = {}
+        for field in self._make_request("/rest/api/3/field"):
+            name = (field.get("name") or "").lower()
+            if name:
+                by_name[name] = None if name in by_name else field.get("id")
+        self._fields_by_name = by_name
+
+        if cache_file:
+            cache[self.base_url] = {"fetched_at": time.time(), "fields": by_name}
+            try:
+                prepare_private_file(cache_file)
+                cache_file.write_text(json.dumps(cache, indent=2))
+            except OSError as e:
+                _log.warning("Could not write field cache %s: %s", cache_file, e)
+        return by_name
+
+    def save_http_cache(self):
+        """Write the ETag cache entries used during this run to http_cache_file."""
+        if not self._http_cache_file:
+            return
+        with self._http_cache_lock:
+            entries = dict(self._http_cache_used)
+        try:
+            prepare_private_file(self._http_cache_file)
+            self._http_cache_file.write_text(json.dumps(entries))
+        except OSError as e:
+            _log.warning("Could not write HTTP cache %s: %s", self._http_cache_file, e)
+
+    def close(self):
+        """Close the issue cache, if any, and the pooled HTTP connections."""
+        if self._issue_cache is not None:
+            self._issue_cache.close()
+            self._issue_cache = None
+        self.session.close()
 
     def test_connection(self) -> dict:
         """Test the Jira connection."""
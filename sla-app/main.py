@@ -6,16 +6,23 @@ Just run: python main.py
 For debug output: python main.py --verbose
 """
 import argparse
+import atexit
+import concurrent.futures
+import hashlib
 import json
 import logging
 import os
 import sys
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import requests
 from datetime import datetime
-from rich.prompt import Prompt, Confirm
-from rich.console import Console
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logging.basicConfig(level=logging.INFO, format="[SLA] %(levelname)s %(message)s")
 _log = logging.getLogger(__name__)
@@ -60,20 +67,27 @@ try:
 except ImportError:
     _log.warning("python-dotenv is not installed — .env file will not be loaded")
 
-from config import JIRA_FIELDS
-from jira_client import JiraClient
-from sla_checker import SLAChecker
-from display import (
-    console,
-    display_sla_dashboard,
-    display_fix_version_tickets,
-    display_error,
-    display_info,
-    display_success,
-)
+from config import FIELDS_CACHE_FILE, HTTP_CACHE_FILE, ISSUE_CACHE_FILE
+
+# requests, rich, numpy and the modules built on them are imported inside the
+# functions that use them, so `main.py --help` does not pay for them
+if TYPE_CHECKING:
+    from jira_client import JiraClient
 
 CONFIG_FILE = Path(__file__).parent / ".config.json"
 
+# A successful connection test is trusted for this long for the same credentials
+CRED_VERIFY_TTL = 3600
+_CRED_KEYS = ("cred_fingerprint", "cred_verified_at", "cred_display_name")
+
+# Values for --sla, in the order the checks run
+SLA_CHOICES = ("all", "first-response", "identification", "resolution", "impact")
+
+# Writes .config.json in the background so a slow disk does not hold up the Jira
+# requests; one worker keeps the writes in order, and pending ones finish at exit
+_IO_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+atexit.register(_IO_POOL.shutdown, wait=True)
+
 
 def get_env_credentials() -> dict | None:
     """Return credentials from environment variables, or None if any are missing."""
@@ -93,19 +107,41 @@ def get_env_credentials() -> dict | None:
 def load_config() -> dict:
     if CONFIG_FILE.exists():
         try:
-            with open(CONFIG_FILE) as f:
-                return json.load(f)
+            with open(CONFIG_FILE, "rb") as f:
+                data = f.read()
+            return orjson.loads(data) if orjson else json.loads(data)
         except Exception:
             return {}
     return {}
 
 
 def save_config(config: dict):
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(config, f, indent=2)
+    if orjson:
+        with open(CONFIG_FILE, "wb") as f:
+            f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+    else:
+        with open(CONFIG_FILE, "w") as f:
+            json.dump(config, f, indent=2)
+
+
+def save_config_async(config: dict):
+    """Queue save_config on _IO_POOL with a snapshot of config, so later edits are not written."""
+    future = _IO_POOL.submit(save_config, dict(config))
+    future.add_done_callback(_log_save_error)
+
+
+def _log_save_error(future: concurrent.futures.Future):
+    """Done-callback for save_config_async: log a failed background write."""
+    exc = future.exception()
+    if exc:
+        _log.warning("Could not save %s: %s", CONFIG_FILE, exc)
 
 
 def prompt_for_credentials(config: dict) -> dict:
+    from rich.prompt import Prompt, Confirm
+    from display import get_console
+
+    console = get_console()
     saved_url = config.get("jira_base_url", "")
     saved_email = config.get("jira_email", "")
 
@@ -142,18 +178,48 @@ def prompt_for_credentials(config: dict) -> dict:
     }
 
 
-def connect_to_jira(creds: dict):
-    """Create a JiraClient, test the connection, and return (client, user_info). Exits on failure."""
+def _cred_fingerprint(creds: dict) -> str:
+    """Short hash identifying a (base_url, email, token) combination without storing the token."""
+    raw = f"{creds['base_url']}|{creds['email']}|{creds['token']}"
+    return hashlib.blake2b(raw.encode(), digest_size=8).hexdigest()
+
+
+def connect_to_jira(creds: dict, config: dict = None):
+    """
+    Create a JiraClient, test the connection, and return (client, user_info). Exits on failure.
+
+    With config, a successful test is recorded in it, and a later run with the same
+    credentials within CRED_VERIFY_TTL skips the test round-trip.
+    """
+    import requests
+    from display import display_error
+    from jira_client import JiraClient
+
     _log.info("Attempting connection to: %s", creds["base_url"])
     _log.info("Connecting as: %s", creds["email"])
+    fingerprint = _cred_fingerprint(creds)
     try:
         client = JiraClient(
             base_url=creds["base_url"],
             email=creds["email"],
             token=creds["token"],
+            http_cache_file=HTTP_CACHE_FILE,
+            issue_cache_file=ISSUE_CACHE_FILE,
         )
+        if (
+            config is not None
+            and config.get("cred_fingerprint") == fingerprint
+            and time.time() - config.get("cred_verified_at", 0) < CRED_VERIFY_TTL
+        ):
+            _log.info("Credentials verified recently — skipping connection test")
+            return client, {"displayName": config.get("cred_display_name") or "Unknown"}
+
         user_info = client.test_connection()
         _log.info("Connection successful — logged in as: %s", user_info.get("displayName"))
+        if config is not None:
+            config["cred_fingerprint"] = fingerprint
+            config["cred_verified_at"] = time.time()
+            config["cred_display_name"] = user_info.get("displayName")
         return client, user_info
     except requests.exceptions.ConnectionError:
         display_error(
@@ -181,6 +247,10 @@ def connect_to_jira(creds: dict):
 
 
 def prompt_for_date_range() -> tuple:
+    from rich.prompt import Prompt
+    from display import get_console, display_error
+
+    console = get_console()
     console.print("\n[bold]Date Range Filter[/]")
     console.print("[dim]Filter tickets by creation date. Leave blank to include all tickets.[/]\n")
 
@@ -198,54 +268,65 @@ def prompt_for_date_range() -> tuple:
     return (date_from or None), (date_to or None)
 
 
-def run_sla_checks(client: JiraClient, verbose: bool = False, date_from: str = None, date_to: str = None):
-    checker = SLAChecker(client, verbose=verbose, date_from=date_from, date_to=date_to)
-
-    checker.set_field_id("health_plan", JIRA_FIELDS["health_plan"])
-    checker.set_field_id("category", JIRA_FIELDS["category"])
-
-    display_info("Fetching tickets from Jira...")
-    console.print()
+def run_sla_checks(client: "JiraClient", verbose: bool = False, date_from: str = None, date_to: str = None,
+                   fast_render: bool = False, sla: str = "all"):
+    """Run the selected SLA check (one of SLA_CHOICES) — or all four — and display each dashboard."""
+    from sla_checker import SLAChecker, resolve_field_ids
+    from display import get_console, display_sla_dashboard, display_fix_version_tickets, display_info
 
-    # SLA 1: Time to First Response (2 business days)
-    summary1 = checker.check_first_response()
-    if summary1.total_count == 0:
-        display_info("No tickets found matching the First Response SLA criteria.")
-    else:
-        display_sla_dashboard(summary1)
+    console = get_console()
+    checker = SLAChecker(client, verbose=verbose, date_from=date_from, date_to=date_to)
 
-    console.rule("[dim]")
-    console.print()
+    for field_name, field_id in resolve_field_ids(client, cache_file=FIELDS_CACHE_FILE).items():
+        checker.set_field_id(field_name, field_id)
 
-    # SLA 2: Identification of Resolution for Configuration Issues (30 days)
-    summary2 = checker.check_identification_resolution_config()
-    if summary2.total_count == 0:
-        display_info("No tickets found matching the Identification SLA criteria.")
-    else:
-        display_sla_dashboard(summary2)
+    selected = SLA_CHOICES[1:] if sla == "all" else (sla,)
+    if len(selected) > 1:
+        # SLAs 1-3 read the same ACS tickets: fetch them once for all three
+        checker.prefetch_source_tickets()
 
-    console.rule("[dim]")
+    display_info("Fetching tickets from Jira...")
     console.print()
 
-    # SLA 3: Resolution of Configuration Issues (60 days)
-    summary3 = checker.check_resolution_config()
-    if summary3.total_count == 0:
-        display_info("No tickets found matching the Resolution SLA criteria.")
-    else:
-        display_sla_dashboard(summary3)
-
-    console.rule("[dim]")
-    console.print()
+    for n, name in enumerate(selected):
+        if n:
+            console.rule("[dim]")
+            console.print()
 
-    # SLA 4: Impact Report Delivery (30 business days)
-    summary4 = checker.check_impact_report_delivery()
-    if summary4.total_count == 0:
-        display_info("No SR sub-tasks found via direct LPM links. Checking fix versions...")
-        console.print()
-        fix_version_data = checker.get_recent_fix_version_lpm_tickets()
-        display_fix_version_tickets(fix_version_data)
-    else:
-        display_sla_dashboard(summary4)
+        if name == "first-response":
+            # SLA 1: Time to First Response (2 business days)
+            summary1 = checker.check_first_response()
+            if summary1.total_count == 0:
+                display_info("No tickets found matching the First Response SLA criteria.")
+            else:
+                display_sla_dashboard(summary1, fast_render=fast_render)
+
+        elif name == "identification":
+            # SLA 2: Identification of Resolution for Configuration Issues (30 days)
+            summary2 = checker.check_identification_resolution_config()
+            if summary2.total_count == 0:
+                display_info("No tickets found matching the Identification SLA criteria.")
+            else:
+                display_sla_dashboard(summary2, fast_render=fast_render)
+
+        elif name == "resolution":
+            # SLA 3: Resolution of Configuration Issues (60 days)
+            summary3 = checker.check_resolution_config()
+            if summary3.total_count == 0:
+                display_info("No tickets found matching the Resolution SLA criteria.")
+            else:
+                display_sla_dashboard(summary3, fast_render=fast_render)
+
+        elif name == "impact":
+            # SLA 4: Impact Report Delivery (30 business days)
+            summary4 = checker.check_impact_report_delivery()
+            if summary4.total_count == 0:
+                display_info("No SR sub-tasks found via direct LPM links. Checking fix versions...")
+                console.print()
+                fix_version_data = checker.get_recent_fix_version_lpm_tickets()
+                display_fix_version_tickets(fix_version_data)
+            else:
+                display_sla_dashboard(summary4, fast_render=fast_render)
 
 
 def main():
@@ -255,8 +336,24 @@ def main():
         action="store_true",
         help="Enable verbose logging to see JQL queries and field values"
     )
+    parser.add_argument(
+        "--fast-render",
+        action="store_true",
+        help="Draw large ticket tables with a lightweight renderer instead of Rich tables"
+    )
+    parser.add_argument(
+        "--sla",
+        choices=SLA_CHOICES,
+        default="all",
+        help="Run a single SLA check instead of all four"
+    )
     args = parser.parse_args()
 
+    import requests
+    from display import get_console, display_error, display_info, display_success
+
+    console = get_console()
+
     console.print()
     console.rule("[bold blue]Healthcare SLA CLI[/]")
     console.print()
@@ -270,19 +367,20 @@ def main():
     if args.verbose:
         console.print("[yellow]Verbose mode enabled[/]\n")
 
+    config = load_config()
     env_creds = get_env_credentials()
     if env_creds:
         console.print("[green]Using Jira credentials from environment variables.[/]\n")
         creds = env_creds
     else:
-        config = load_config()
         creds = prompt_for_credentials(config)
-        save_config(config)
+        save_config_async(config)
 
     console.print()
     display_info("Connecting to Jira...")
 
-    client, user_info = connect_to_jira(creds)
+    client, user_info = connect_to_jira(creds, config)
+    save_config_async(config)
     display_success(f"Connected as: {user_info.get('displayName', 'Unknown')}")
 
     date_from, date_to = prompt_for_date_range()
@@ -295,11 +393,20 @@ def main():
     console.print()
 
     try:
-        run_sla_checks(client, verbose=args.verbose, date_from=date_from, date_to=date_to)
+        run_sla_checks(client, verbose=args.verbose, date_from=date_from, date_to=date_to,
+                       fast_render=args.fast_render, sla=args.sla)
     except Exception as e:
+        if isinstance(e, requests.exceptions.HTTPError) and getattr(e.response, "status_code", None) == 401:
+            # Credentials stopped working since they were verified — test them next run
+            for key in _CRED_KEYS:
+                config.pop(key, None)
+            save_config_async(config)
         display_error(f"SLA check failed: {e}")
         sys.exit(1)
-
+    else:
+        client.save_http_cache()
+    finally:
+        client.close()
     console.print()
 
 
@@ -1,58 +1,215 @@
 """
 SLA Calculator for Healthcare SLA CLI
 """
-from datetime import datetime, timedelta
-from typing import Optional
+import re
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Any, Optional, Union
 import numpy as np
 
+# Jira timestamps: "2024-01-15T09:30:00.000+0000", "...Z", "2024-01-15 09:30:00", "2024-01-15"
+_ISO_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})(?:[T ](\d{2}:\d{2}:\d{2})(\.\d+)?)?(Z|[+-]\d{2}:?\d{2})?$")
 
-def get_business_days(start_date: datetime, end_date: datetime) -> int:
+# Anything get_business_days accepts (a datetime is a date)
+DateLike = Union[date, np.datetime64]
+
+
+def _to_d64(value: DateLike) -> np.datetime64:
+    """A datetime, date or numpy datetime64 as a day-precision datetime64."""
+    if isinstance(value, np.datetime64):
+        return value.astype("datetime64[D]")
+    if isinstance(value, datetime):
+        value = value.date()
+    return np.datetime64(value, "D")
+
+
+def get_business_days(start_date: DateLike, end_date: DateLike) -> int:
     """
     Calculate the number of business days between two dates.
     Excludes weekends (Saturday and Sunday).
+
+    Accepts datetime, date or numpy datetime64 values; only the day is used,
+    so a same-day pair counts 0 whatever the times.
     """
-    if end_date < start_date:
+    if isinstance(start_date, np.datetime64) or isinstance(end_date, np.datetime64):
+        start, end = _to_d64(start_date), _to_d64(end_date)
+        return int(np.busday_count(start, end)) if end >= start else 0
+
+    # Plain date compares are cheaper than datetime64 ones, and let a date meet a datetime
+    start = start_date.date() if isinstance(start_date, datetime) else start_date
+    end = end_date.date() if isinstance(end_date, datetime) else end_date
+    if end < start:
         return 0
 
-    # Use numpy busday_count for efficiency
-    start = np.datetime64(start_date.date())
-    end = np.datetime64(end_date.date())
+    return _busday_count(start, end)
+
 
+@lru_cache(maxsize=65536)
+def _busday_count(start: date, end: date) -> int:
+    """
+    numpy.busday_count for one pair of days. Memoized — tickets created on the same
+    day share their spans to the same "now" or resolution day, and the count for a
+    pair of days never changes, so entries never go stale.
+    """
     return int(np.busday_count(start, end))
 
 
-def get_business_days_elapsed(start_date: datetime) -> int:
-    """Calculate business days from start_date until now."""
-    return get_business_days(start_date, datetime.now())
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _to_day_array(dates: list[date]) -> np.ndarray:
+    """
+    Dates or datetimes as a datetime64[D] array, built from their day ordinals.
+    Converting date objects to datetime64 one by one costs far more than the
+    busday_count they feed; integer ordinals cast to days in a single step.
+    """
+    ordinals = np.fromiter((d.toordinal() for d in dates), dtype=np.int64, count=len(dates))
+    return (ordinals - _EPOCH_ORDINAL).astype("datetime64[D]")
+
+
+def get_business_days_batch(start_dates: list[datetime], end_dates: Union[list[datetime], date]) -> np.ndarray:
+    """
+    Vectorized get_business_days: business days for each start/end pair in a
+    single numpy.busday_count call. Pairs that end before they start count as 0.
+    end_dates may also be one date or datetime shared by every start (e.g. now),
+    which numpy broadcasts instead of converting a list of copies.
+    """
+    if isinstance(end_dates, date):
+        ends = np.datetime64(end_dates.toordinal() - _EPOCH_ORDINAL, "D")
+    else:
+        ends = _to_day_array(end_dates)
+    return np.maximum(np.busday_count(_to_day_array(start_dates), ends), 0)
+
+
+class BusinessDayTable:
+    """
+    Business-day counts from a prefix sum over a fixed window of dates, so
+    count(a, b) is two list lookups and a subtraction instead of a NumPy call.
+    Matches get_business_days, which it falls back to outside the window.
+    """
+
+    def __init__(self, first_day: date, last_day: date):
+        self.first_day = first_day
+        days = np.arange(np.datetime64(first_day, "D"), np.datetime64(last_day, "D") + 1)
+        # _prefix[i] = business days in [first_day, first_day + i)
+        self._prefix = [0] + np.cumsum(np.is_busday(days)).tolist()
+
+    def count(self, start_date: datetime, end_date: datetime) -> int:
+        if end_date < start_date:
+            return 0
+        i = (start_date.date() - self.first_day).days
+        j = (end_date.date() - self.first_day).days
+        if i >= 0 and j < len(self._prefix):
+            return self._prefix[j] - self._prefix[i]
+        return get_business_days(start_date, end_date)
+
+
+def get_business_days_elapsed(start_date: datetime, now: Optional[datetime] = None) -> int:
+    """Calculate business days from start_date until now (pass now to reuse one snapshot across tickets)."""
+    return get_business_days(start_date, now or datetime.now())
 
 
-def parse_jira_date(date_field) -> Optional[datetime]:
+def parse_jira_date(date_field: Any) -> Optional[datetime]:
     """Parse Jira date field into datetime object (timezone-naive)."""
     if not date_field:
         return None
 
     if isinstance(date_field, str):
-        formats = [
-            "%Y-%m-%dT%H:%M:%S.%f%z",
-            "%Y-%m-%dT%H:%M:%S%z",
-            "%Y-%m-%dT%H:%M:%S.%fZ",
-            "%Y-%m-%dT%H:%M:%SZ",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d",
-        ]
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(date_field, fmt)
-                # Convert to naive datetime to avoid comparison issues
-                if dt.tzinfo is not None:
-                    dt = dt.replace(tzinfo=None)
-                return dt
-            except ValueError:
-                continue
+        return _parse_date_str(date_field)
     return None
 
 
-def extract_field_value(field, default: str = "Unknown") -> str:
+@lru_cache(maxsize=8192)
+def _parse_date_str(date_field: str) -> Optional[datetime]:
+    """
+    String branch of parse_jira_date. Memoized — the same timestamps recur across
+    changelogs shared by several tickets, and datetimes are immutable.
+    """
+    m = _ISO_RE.match(date_field)
+    if m:
+        # The UTC offset would be dropped anyway, so rebuild just the wall-clock
+        # part in a form fromisoformat accepts on every Python version
+        # (6-digit fraction, no offset) — one C call instead of a strptime sweep
+        day, clock, frac = m.group(1, 2, 3)
+        if clock:
+            day = f"{day}T{clock}{frac[:7].ljust(7, '0') if frac else ''}"
+        try:
+            return datetime.fromisoformat(day)
+        except ValueError:
+            pass  # e.g. an out-of-range month; let the strptime sweep decide
+    dt = _parse_jira_date_slow(date_field)
+    # Convert to naive datetime to avoid comparison issues
+    if dt is not None and dt.tzinfo is not None:
+        dt = dt.replace(tzinfo=None)
+    return dt
+
+
+_TZ_SUFFIX_RE = re.compile(r"(?:Z|[+-]\d{2}:?\d{2})$")
+
+
+def parse_jira_dates_batch(date_fields: list[Any]) -> list[Optional[datetime]]:
+    """
+    parse_jira_date over a whole column of values in one numpy datetime64 cast.
+    UTC offsets are stripped first so the wall-clock time is kept, as
+    parse_jira_date does. If numpy rejects any value, or a value comes back as
+    NaT, those values go through parse_jira_date instead.
+    """
+    strs = [_TZ_SUFFIX_RE.sub("", f) if isinstance(f, str) and f else "NaT" for f in date_fields]
+    try:
+        parsed = np.array(strs, dtype="datetime64[us]").tolist()
+    except ValueError:
+        return [parse_jira_date(f) for f in date_fields]
+    return [dt if dt is not None else parse_jira_date(f) for dt, f in zip(parsed, date_fields)]
+
+
+_STRPTIME_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S.%f%z",
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%dT%H:%M:%S.%fZ",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+)
+
+# Sweep order for each guessed format: the guess first, then the rest in order
+_STRPTIME_SWEEPS = {
+    guess: (guess, *(f for f in _STRPTIME_FORMATS if f != guess))
+    for guess in _STRPTIME_FORMATS
+}
+
+
+def _guess_strptime_format(date_field: str) -> str:
+    """Pick the most likely _STRPTIME_FORMATS entry from the string's shape."""
+    if len(date_field) == 10:
+        return "%Y-%m-%d"
+    has_fraction = "." in date_field
+    if date_field.endswith("Z"):
+        return "%Y-%m-%dT%H:%M:%S.%fZ" if has_fraction else "%Y-%m-%dT%H:%M:%SZ"
+    if len(date_field) > 19 and ("+" in date_field[19:] or "-" in date_field[19:]):
+        return "%Y-%m-%dT%H:%M:%S.%f%z" if has_fraction else "%Y-%m-%dT%H:%M:%S%z"
+    return "%Y-%m-%d %H:%M:%S"
+
+
+def _parse_jira_date_slow(date_field: str) -> Optional[datetime]:
+    """
+    Fallback for date strings that do not match _ISO_RE. Tries the format the
+    string looks like first, and only sweeps the rest if that one fails.
+    """
+    for fmt in _STRPTIME_SWEEPS[_guess_strptime_format(date_field)]:
+        try:
+            return datetime.strptime(date_field, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+# Keys that hold a Jira option/select field's display value, in order of preference
+_FIELD_VALUE_KEYS = ("value", "displayValue", "name", "key")
+_MISSING = object()
+
+
+def extract_field_value(field: Any, default: str = "Unknown") -> str:
     """Extract value from various Jira field structures."""
     if field is None:
         return default
@@ -61,9 +218,11 @@ def extract_field_value(field, default: str = "Unknown") -> str:
         return field
 
     if isinstance(field, dict):
-        for key in ["value", "displayValue", "name", "key"]:
-            if key in field:
-                return field[key]
+        # One lookup per key; the sentinel keeps present-but-falsy values (e.g. "") as before
+        for key in _FIELD_VALUE_KEYS:
+            value = field.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
         return str(field)
 
     if isinstance(field, list) and len(field) > 0:
@@ -75,18 +234,38 @@ def extract_field_value(field, default: str = "Unknown") -> str:
 def format_elapsed_time(start: datetime, end: datetime) -> str:
     """Format the elapsed time between two datetimes as 'Xd Xh Xm'."""
     delta = end - start
-    if delta.total_seconds() < 0:
+    if delta.days < 0:
         return "0d 0h 0m"
-    total_minutes = int(delta.total_seconds() // 60)
-    days = total_minutes // (24 * 60)
-    hours = (total_minutes % (24 * 60)) // 60
-    minutes = total_minutes % 60
-    return f"{days}d {hours}h {minutes}m"
+    # timedelta is already normalized to days + seconds (< 1 day): integer math only
+    hours, rem = divmod(delta.seconds, 3600)
+    return f"{delta.days}d {hours}h {rem // 60}m"
+
+
+# A linked LPM ticket that reached the target status; date is None if unparseable.
+# Unpacks like the (lpm_key, transition_date) pair it replaces.
+LinkCandidate = namedtuple("LinkCandidate", "key date")
 
 
 class SLAResult:
     """Result for a single ticket's SLA evaluation."""
 
+    # No per-instance __dict__: smaller results and faster attribute reads
+    __slots__ = (
+        "source_ticket",
+        "target_ticket",
+        "created_date",
+        "resolved_date",
+        "days_elapsed",
+        "target_days",
+        "status",
+        "source_of_identification",
+        "category_migrated",
+        "lpm_category",
+        "elapsed_time_str",
+        "lpm_candidates",
+        "target_category",
+    )
+
     def __init__(
         self,
         source_ticket: str,
@@ -100,7 +279,7 @@ class SLAResult:
         category_migrated: str = "",
         lpm_category: str = "",
         elapsed_time_str: Optional[str] = None,
-        lpm_candidates: list = None,   # [(lpm_key, transition_date_or_None), ...]
+        lpm_candidates: Optional[list] = None,   # [LinkCandidate(lpm_key, transition_date_or_None), ...]
         target_category: str = "",     # category field of the linked LPM ticket
     ):
         self.source_ticket = source_ticket
@@ -130,16 +309,78 @@ class SLAResult:
         return self.status == "in_progress"
 
 
+# Status codes stored in SLASummary's status_code column
+_STATUS_CODES = {"met": 0, "breached": 1, "in_progress": 2}
+_OTHER_STATUS_CODE = 3
+
+# SLASummary column store: name -> dtype
+_COLUMN_DTYPES = {
+    "days_elapsed": np.int64,
+    "target_days": np.int64,
+    "status_code": np.uint8,
+}
+
+
 class SLASummary:
-    """Summary of SLA results."""
+    """
+    Summary of SLA results.
+
+    Results are bucketed by status as they are added, so the counts and filtered
+    lists below cost nothing to read, and their hot fields are written into
+    parallel NumPy columns (see columns()). Assigning to results rebuilds both;
+    set a result's fields before adding it, not after.
+    """
 
     def __init__(self, sla_name: str, target_days: int):
         self.sla_name = sla_name
         self.target_days = target_days
-        self.results: list[SLAResult] = []
+        self.results = []
+
+    @property
+    def results(self) -> list[SLAResult]:
+        return self._results
+
+    @results.setter
+    def results(self, results: list[SLAResult]):
+        self._results: list[SLAResult] = []
+        self._by_status: dict[str, list[SLAResult]] = {"met": [], "breached": [], "in_progress": []}
+        self._columns = {name: np.empty(max(16, len(results)), dtype=dtype) for name, dtype in _COLUMN_DTYPES.items()}
+        for result in results:
+            self.add_result(result)
 
     def add_result(self, result: SLAResult):
-        self.results.append(result)
+        n = len(self._results)
+        self._results.append(result)
+        bucket = self._by_status.get(result.status)
+        if bucket is not None:
+            bucket.append(result)
+
+        columns = self._columns
+        if n == len(columns["status_code"]):
+            # Out of room — double every column's capacity
+            for name, col in columns.items():
+                grown = np.empty(2 * n, dtype=col.dtype)
+                grown[:n] = col
+                columns[name] = grown
+        columns["days_elapsed"][n] = result.days_elapsed
+        columns["target_days"][n] = result.target_days
+        columns["status_code"][n] = _STATUS_CODES.get(result.status, _OTHER_STATUS_CODE)
+
+    def columns(self) -> dict[str, np.ndarray]:
+        """
+        Hot per-result fields as parallel NumPy arrays, index-aligned with results,
+        so large summaries can be classified and ordered without per-object work:
+        days_elapsed, target_days, status_code (see _STATUS_CODES), plus is_met /
+        is_breached masks. The columns are read-only views, valid until
+        the next add_result.
+        """
+        n = len(self._results)
+        cols = {name: col[:n] for name, col in self._columns.items()}
+        for col in cols.values():
+            col.flags.writeable = False
+        cols["is_met"] = cols["status_code"] == _STATUS_CODES["met"]
+        cols["is_breached"] = cols["status_code"] == _STATUS_CODES["breached"]
+        return cols
 
     @property
     def total_count(self) -> int:
@@ -147,27 +388,27 @@ class SLASummary:
 
     @property
     def met_count(self) -> int:
-        return sum(1 for r in self.results if r.is_met)
+        return len(self._by_status["met"])
 
     @property
     def breached_count(self) -> int:
-        return sum(1 for r in self.results if r.is_breached)
+        return len(self._by_status["breached"])
 
     @property
     def in_progress_count(self) -> int:
-        return sum(1 for r in self.results if r.is_in_progress)
+        return len(self._by_status["in_progress"])
 
     @property
     def met_results(self) -> list[SLAResult]:
-        return [r for r in self.results if r.is_met]
+        return self._by_status["met"]
 
     @property
     def breached_results(self) -> list[SLAResult]:
-        return [r for r in self.results if r.is_breached]
+        return self._by_status["breached"]
 
     @property
     def in_progress_results(self) -> list[SLAResult]:
-        return [r for r in self.results if r.is_in_progress]
+        return self._by_status["in_progress"]
 
     @property
     def compliance_rate(self) -> float:
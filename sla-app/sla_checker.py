@@ -1,24 +1,84 @@
 """
 SLA Checker - Main logic for evaluating SLAs
 """
-from datetime import datetime
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime
+from operator import attrgetter
+from pathlib import Path
 from typing import Optional
 
-from rich.console import Console
-
-from jira_client import JiraClient
+from display import get_console
+from jira_client import JiraClient, fold_statuses
 from sla_calculator import (
+    BusinessDayTable,
+    LinkCandidate,
     SLAResult,
     SLASummary,
     get_business_days,
+    get_business_days_batch,
     get_business_days_elapsed,
     parse_jira_date,
+    parse_jira_dates_batch,
     extract_field_value,
     format_elapsed_time,
 )
-from config import SLA_DEFINITIONS, JIRA_FIELDS, SOURCE_OF_ID_FIELD_ID, CATEGORY_FIELD_ID
+from config import SLA_DEFINITIONS, JIRA_FIELDS, JIRA_FIELD_NAMES
+
+_log = logging.getLogger(__name__)
+
+# Issue keys per "key in (...)" bulk search — keeps the JQL well under Jira's length limits
+_KEY_BATCH_SIZE = 100
+
+# The SLAs evaluated from the same LA Blue ACS tickets
+_SOURCE_SLAS = ("first_response", "identification_resolution_config", "resolution_config")
+# project, date/cancelled filter clauses, health plan field, health plan value
+_SOURCE_JQL = 'project = %s%s AND "%s" = "%s" ORDER BY created DESC'
+
+# Concurrent comment requests or key-batch searches — enough to hide latency, few enough
+# for Jira's rate limits
+_REQUEST_WORKERS = 8
+
+# An LPM ticket's category rarely changes: reuse one fetched by a run in the last 6 hours
+_LPM_CATEGORY_MAX_AGE = 6 * 3600
+
+# Sort key for LinkCandidate; a C-level getter instead of a per-item lambda
+_CANDIDATE_DATE = attrgetter("date")
+
+# Casefolded status names, compared against casefolded Jira statuses
+_CANCELED_STATUSES = frozenset({"cancelled", "canceled"})
+# ACS tickets with no LPM ticket are dropped from SLAs 2 and 3 once in one of these
+_EXCLUDED_UNLINKED_STATUSES = frozenset({"closed", "resolved", "canceled"})
+
+
+def resolve_field_ids(jira_client: JiraClient, cache_file: Path = None) -> dict:
+    """
+    Look up the custom field IDs by name on the Jira instance (cached in cache_file
+    for 24h), falling back to the JIRA_FIELDS constants in config.py for any name
+    that is missing or ambiguous.
+    """
+    field_ids = dict(JIRA_FIELDS)
+    try:
+        by_name = jira_client.get_fields_by_name(cache_file=cache_file)
+    except Exception as e:
+        _log.warning("Could not look up Jira field IDs by name: %s — using config.py values", e)
+        return field_ids
+
+    for key, name in JIRA_FIELD_NAMES.items():
+        field_id = by_name.get(name.lower())
+        if field_id:
+            field_ids[key] = field_id
+        else:
+            _log.info("Field %r not resolved by name — using config.py value %s", name, field_ids[key])
+    return field_ids
 
-console = Console()
+
+def _status_of(issue: dict) -> str:
+    """An issue's casefolded status name, or "" if it has none — plain subscripts, no default dicts."""
+    try:
+        return issue["fields"]["status"]["name"].casefold()
+    except (KeyError, TypeError, AttributeError):
+        return ""
 
 
 class SLAChecker:
@@ -27,20 +87,46 @@ class SLAChecker:
     def __init__(self, jira_client: JiraClient, verbose: bool = False, date_from: str = None, date_to: str = None, log_collector: list = None, progress_callback=None):
         self.jira = jira_client
         self.field_ids = JIRA_FIELDS.copy()
+        self._cache_field_ids()
         self.verbose = verbose
         self.date_from = date_from
         self.date_to = date_to
+        self._date_filter = self._date_filter_jql()  # the date range is fixed for the checker's life
+        # LA Blue source-ticket JQL of SLAs 1–3, bound once from their definitions
+        self._source_jqls = {
+            name: _SOURCE_JQL % (
+                SLA_DEFINITIONS[name]["source_project"], self._date_filter,
+                SLA_DEFINITIONS[name]["health_plan_field"], SLA_DEFINITIONS[name]["health_plan_value"],
+            )
+            for name in _SOURCE_SLAS
+        }
         self.log_collector = log_collector
         self.progress_callback = progress_callback  # callable(current, total, ticket_key) or None
+        self._bd_table: Optional[BusinessDayTable] = None  # rebuilt per check from its tickets
+        self._dates: Optional[tuple] = None  # (tickets, created dates, table) of the last _ticket_dates call
+        # {LPM key: its first target-status transition, or None}, reset per LPM check since the
+        # targets differ; an LPM ticket linked from several ACS tickets is scanned once
+        self._transitions: dict = {}
+        self._target_statuses: frozenset = frozenset()  # that check's targets, folded once
+        # Jira data shared between the checks of one run (SLAs 2 and 3 read the same tickets)
+        self._searches: dict = {}  # {jql: (fields, issues)}
+        self._linked: dict = {}    # {linked key: (full histories, category)}
+        self._issues: dict = {}    # {issue key: fields fetched by get_issue so far}
+        self._now = datetime.now()  # snapshot taken at the start of each check
 
     def _tick(self, current: int, total: int, ticket_key: str = ""):
         """Report per-ticket progress to the registered callback, if any."""
         if self.progress_callback:
             self.progress_callback(current, total, ticket_key)
 
+    @property
+    def _logging(self) -> bool:
+        """Whether _log output goes anywhere — per-link loops check it before building messages."""
+        return self.verbose or self.log_collector is not None
+
     def _log(self, message: str, style: str = "dim"):
         if self.verbose:
-            console.print(f"[{style}]{message}[/]")
+            get_console().print(f"[{style}]{message}[/]")
         if self.log_collector is not None:
             if "red" in style:
                 level = "error"
@@ -59,16 +145,312 @@ class SLAChecker:
     def set_field_id(self, field_name: str, field_id: str):
         """Set a custom field ID."""
         self.field_ids[field_name] = field_id
+        self._cache_field_ids()
+
+    def _cache_field_ids(self):
+        """Keep the field IDs read on per-ticket paths in attributes, off the field_ids dict."""
+        self._category_field = self.field_ids.get("category", "")
+        self._source_of_id_field = self.field_ids.get("source_of_identification", "")
+        self._health_plan_field = self.field_ids.get("health_plan", "")
 
     def _date_filter_jql(self) -> str:
-        """Build JQL filter clauses — always excludes cancelled tickets, plus any date range."""
-        parts = ['status NOT IN ("Cancelled", "Canceled")']
+        """
+        Build the leading JQL filter clauses — any date range first, as the most selective
+        predicate, then the exclusion of cancelled tickets.
+        """
+        parts = []
         if self.date_from:
             parts.append(f'created >= "{self.date_from}"')
         if self.date_to:
             parts.append(f'created <= "{self.date_to}"')
+        parts.append('status NOT IN ("Cancelled", "Canceled")')
         return " AND " + " AND ".join(parts)
 
+    def _source_fields(self) -> list[str]:
+        """Every ACS field SLAs 1–3 read (the health plan only for the verbose sample log)."""
+        # created: SLA start; status: skip excluded unlinked tickets; issuelinks: LPM candidates;
+        # source of identification and category: shown per result
+        fields = ["created", "status", "issuelinks", self._source_of_id_field, self._category_field]
+        if self._logging:
+            fields.append(self._health_plan_field)
+        return fields
+
+    def prefetch_source_tickets(self):
+        """
+        Fetch the ACS tickets of SLAs 1–3 in a single search requesting the union of
+        the fields they read. Call it before running several of those checks: their
+        own searches are then answered from this result (see _search_issues).
+        """
+        fields = self._source_fields() + ["comment"]  # inline comments for SLA 1
+        for jql in dict.fromkeys(self._source_jqls.values()):
+            self._log(f"Prefetching source tickets: {jql}", "yellow")
+            self._search_issues(jql, fields)
+
+    def _prefetch_linked_issues(self, source_tickets: list[dict], target_project: str,
+                                target_statuses: list[str] = None) -> tuple[dict, dict]:
+        """
+        Bulk-fetch changelogs and category values for every non-canceled target-project
+        ticket linked from source_tickets, using paged "key in (...)" searches with
+        expand=changelog.
+
+        With target_statuses, the searches also filter on "status was in (...)", so
+        only tickets that ever reached one of them are downloaded; the rest get an
+        empty history, which is all the evaluators would find in theirs anyway.
+
+        Tickets already downloaded by an earlier check of this run are not fetched again.
+
+        Keys of a failed batch have their changelogs fetched one by one, concurrently.
+
+        Returns ({issue_key: histories}, {issue_key: category}). Keys still missing from
+        the result fall back to per-issue requests in the evaluators.
+        """
+        linked_keys = set()
+        for ticket in source_tickets:
+            for link in ticket.get("fields", {}).get("issuelinks", []):
+                linked_issue = link.get("outwardIssue") or link.get("inwardIssue")
+                if not linked_issue:
+                    continue
+                linked_key = linked_issue.get("key", "")
+                if not linked_key.startswith(target_project):
+                    continue
+                linked_status = _status_of(linked_issue)
+                if linked_status not in _CANCELED_STATUSES:
+                    linked_keys.add(linked_key)
+
+        status_clause = ""
+        if target_statuses:
+            quoted = ", ".join(f'"{status}"' for status in target_statuses)
+            status_clause = f" AND status was in ({quoted})"
+
+        cat_field = self._category_field
+        fields = ["updated", cat_field]
+        changelogs, categories = {}, {}
+        for key in linked_keys & self._linked.keys():
+            changelogs[key], categories[key] = self._linked[key]
+        keys = sorted(linked_keys - self._linked.keys())
+
+        def fetch(batch):
+            """(issues, whether the status filter applied), or None if the batch failed."""
+            key_clause = f'key in ({", ".join(batch)})'
+            if status_clause:
+                try:
+                    return self.jira.search_issues_with_changelog(key_clause + status_clause, fields=fields), True
+                except Exception as e:
+                    # e.g. a target status that no longer exists makes the JQL invalid
+                    self._log(f"Status-filtered changelog fetch failed ({e}) — retrying without the filter", "red")
+            try:
+                return self.jira.search_issues_with_changelog(key_clause, fields=fields), False
+            except Exception as e:
+                self._log(f"Bulk changelog fetch failed for {len(batch)} {target_project} tickets: {e}", "red")
+                return None
+
+        matched = 0
+        for batch, fetched in self._map_key_batches(keys, fetch):
+            if fetched is None:
+                continue
+            issues, filtered = fetched
+            for issue in issues:
+                key = issue["key"]
+                changelogs[key] = issue["changelog"]["histories"]
+                categories[key] = extract_field_value(issue.get("fields", {}).get(cat_field), default="") if cat_field else ""
+                self._linked[key] = (changelogs[key], categories[key])
+            matched += len(issues)
+            if filtered:
+                for key in batch:
+                    changelogs.setdefault(key, [])
+
+        missing = [key for key in keys if key not in changelogs]
+        if missing:
+            self._log(f"Fetching changelogs one by one for {len(missing)} {target_project} tickets", "dim")
+            for key, histories in self._fetch_each(self.jira.get_issue_changelog, missing).items():
+                if not isinstance(histories, Exception):
+                    changelogs[key] = histories
+
+        self._log(
+            f"Prefetched changelogs for {len(changelogs)} of {len(linked_keys)} linked {target_project} tickets "
+            f"({matched} downloaded, {len(linked_keys) - len(keys)} reused from an earlier check)", "dim"
+        )
+        return changelogs, categories
+
+    def _search_issues(self, jql: str, fields: list[str]) -> list[dict]:
+        """search_issues, reusing an earlier identical query of this run that requested at least these fields."""
+        cached = self._searches.get(jql)
+        if cached is not None and set(fields) <= cached[0]:
+            self._log("  (reusing the results of an identical earlier query)", "dim")
+            return cached[1]
+        issues = self.jira.search_issues(jql, fields=fields)
+        self._searches[jql] = (set(fields), issues)
+        return issues
+
+    def _map_key_batches(self, keys: list[str], fetch) -> list[tuple]:
+        """
+        [(batch, fetch(batch))] for each _KEY_BATCH_SIZE slice of keys, in order.
+        "key in (...)" searches are independent of each other — unlike the pages of
+        one search, which nextPageToken chains — so up to _REQUEST_WORKERS run at once.
+        """
+        batches = [keys[i:i + _KEY_BATCH_SIZE] for i in range(0, len(keys), _KEY_BATCH_SIZE)]
+        if len(batches) < 2:
+            return [(batch, fetch(batch)) for batch in batches]
+        with ThreadPoolExecutor(max_workers=min(_REQUEST_WORKERS, len(batches))) as pool:
+            return list(zip(batches, pool.map(fetch, batches)))
+
+    def _fetch_issue_links(self, issue_keys: list[str]) -> dict:
+        """
+        issuelinks of every key, via "key in (...)" searches of _KEY_BATCH_SIZE keys
+        instead of one get_issue per key. Returns {issue_key: issuelinks}; keys of a
+        failed batch are missing, and the caller falls back to get_issue for them.
+        """
+        def fetch(batch):
+            try:
+                return self.jira.search_issues(f'key in ({", ".join(batch)})', fields=["issuelinks"])
+            except Exception as e:
+                self._log(f"Bulk issue-link fetch failed for {len(batch)} tickets: {e}", "red")
+                return None
+
+        links_by_key = {}
+        for _, issues in self._map_key_batches(issue_keys, fetch):
+            for issue in issues or ():
+                links_by_key[issue["key"]] = issue.get("fields", {}).get("issuelinks", [])
+        return links_by_key
+
+    def _fetch_comments_inline(self, issue_keys: list[str]) -> dict:
+        """
+        Comments of every key, read inline from "key in (...)" searches of
+        _KEY_BATCH_SIZE keys (see _inline_comments). Keys of a failed batch are
+        missing, and the caller falls back to get_issue_comments for them.
+        """
+        def fetch(batch):
+            try:
+                return self.jira.search_issues(f'key in ({", ".join(batch)})', fields=["comment"], cached=True)
+            except Exception as e:
+                self._log(f"Bulk comment fetch failed for {len(batch)} tickets: {e}", "red")
+                return None
+
+        comments_by_key = {}
+        for _, issues in self._map_key_batches(issue_keys, fetch):
+            if issues is not None:
+                comments_by_key.update(self._inline_comments(issues))
+        return comments_by_key
+
+    def _get_issue_cached(self, issue_key: str, fields: list[str], max_age: int = None) -> dict:
+        """
+        get_issue, answered from fields already fetched for issue_key during this run
+        when possible. max_age also lets the client's issue cache answer from a recent run.
+        """
+        known = self._issues.setdefault(issue_key, {})
+        if any(field not in known for field in fields):
+            known.update(self.jira.get_issue(issue_key, fields=fields, max_age=max_age).get("fields", {}))
+        return {"key": issue_key, "fields": known}
+
+    def _fetch_each(self, fetch, issue_keys: list[str]) -> dict:
+        """
+        fetch(issue_key) for every key, _REQUEST_WORKERS requests at a time — for the
+        per-issue requests no bulk search can replace. Returns {issue_key: result}; a
+        failed fetch maps to its exception, so the caller can log it alongside the
+        rest of that ticket's output.
+        """
+        results = {}
+        with ThreadPoolExecutor(max_workers=_REQUEST_WORKERS) as pool:
+            futures = {pool.submit(fetch, key): key for key in issue_keys}
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as e:
+                    results[futures[future]] = e
+        return results
+
+    @staticmethod
+    def _pick_candidate(candidates: list) -> LinkCandidate:
+        """
+        Most recent transition wins, keeping the first of any ties. Undated candidates
+        only win when none has a date, so the key needs no None guard.
+        """
+        dated = [c for c in candidates if c.date]
+        return max(dated, key=_CANDIDATE_DATE) if dated else candidates[0]
+
+    def _inline_comments(self, tickets: list[dict]) -> dict:
+        """
+        Comments of each ticket, from the "comment" field returned by its search.
+        Jira inlines only the first page of comments, so tickets with more are
+        fetched in full through _fetch_each. Same shape as _fetch_each.
+        """
+        comments_by_key = {}
+        truncated = []
+        for ticket in tickets:
+            inline = ticket.get("fields", {}).get("comment") or {}
+            comments = inline.get("comments", [])
+            if inline.get("total", len(comments)) > len(comments):
+                truncated.append(ticket.get("key"))
+            else:
+                comments_by_key[ticket.get("key")] = comments
+        if truncated:
+            self._log(f"Fetching all comments for {len(truncated)} ticket(s) with more than one page", "dim")
+            comments_by_key.update(self._fetch_each(self.jira.get_issue_comments, truncated))
+        return comments_by_key
+
+    @staticmethod
+    def _created_dates(tickets: list[dict]) -> dict:
+        """Parsed creation date of each ticket, as {issue_key: datetime}, in one batch."""
+        parsed = parse_jira_dates_batch([t.get("fields", {}).get("created") for t in tickets])
+        return {t.get("key"): d for t, d in zip(tickets, parsed) if d}
+
+    def _business_days_to_now(self, created_dates: dict) -> dict:
+        """
+        Business days from each ticket's creation until now, as {issue_key: days}.
+        Computed in one vectorized batch so the per-ticket loops only need a lookup
+        for tickets that have not reached their SLA event yet.
+        """
+        days = get_business_days_batch(list(created_dates.values()), self._now)
+        return dict(zip(created_dates.keys(), days.tolist()))
+
+    def _build_business_day_table(self, created_dates: dict) -> Optional[BusinessDayTable]:
+        """Business-day lookup table spanning the earliest ticket creation date to today."""
+        first_day = min((d.date() for d in created_dates.values()), default=None)
+        if first_day is None:
+            return None
+        return BusinessDayTable(first_day, max(first_day, date.today()))
+
+    def _skip_unlinked(self, ticket: dict, result: SLAResult = None) -> bool:
+        """
+        Whether SLAs 2 and 3 drop ticket: it has no LPM ticket and is already closed,
+        resolved or canceled. Before evaluation (no result) only a ticket without any
+        issue links can be ruled out, which saves evaluating it; after evaluation any
+        result without a target ticket can.
+        """
+        if result is None:
+            if ticket.get("fields", {}).get("issuelinks"):
+                return False
+        elif result.target_ticket:
+            return False
+        ticket_status = _status_of(ticket)
+        if ticket_status not in _EXCLUDED_UNLINKED_STATUSES:
+            return False
+        if self._logging:
+            self._log(f"  Excluding {ticket.get('key')}: no LPM ticket and status is '{ticket_status}'", "dim")
+        return True
+
+    def _ticket_dates(self, tickets: list[dict]) -> tuple[dict, dict]:
+        """
+        (created_dates, elapsed_to_now) for a check's tickets, setting up the check's
+        business-day table. The ACS checks get the same list back from _search_issues,
+        so its parsed dates and table are built once and shared; only the days-to-now
+        batch is redone against each check's own snapshot of now.
+        """
+        cached = self._dates
+        if cached is not None and cached[0] is tickets:
+            created_dates, self._bd_table = cached[1], cached[2]
+        else:
+            created_dates = self._created_dates(tickets)
+            self._bd_table = self._build_business_day_table(created_dates)
+            self._dates = (tickets, created_dates, self._bd_table)
+        return created_dates, self._business_days_to_now(created_dates)
+
+    def _get_business_days(self, start_date: datetime, end_date: datetime) -> int:
+        """get_business_days, answered from the current check's lookup table when there is one."""
+        if self._bd_table is not None:
+            return self._bd_table.count(start_date, end_date)
+        return get_business_days(start_date, end_date)
+
     def _is_public_comment(self, comment: dict) -> bool:
         """Check if a comment is publicly visible (not an internal note)."""
         jsd_public = comment.get("jsdPublic")
@@ -132,53 +514,75 @@ class SLAChecker:
             sla_name=sla_config["name"],
             target_days=sla_config["target_days"],
         )
+        self._now = datetime.now()
 
-        health_plan_field = self.field_ids.get("health_plan", "")
         acs_project = sla_config["acs_project"]
         target_days = sla_config["target_days"]
 
         jql = (
-            f'project = {sla_config["sr_project"]} '
+            f'project = {sla_config["sr_project"]}'
+            f'{self._date_filter} '
             f'AND issuetype = Sub-task '
-            f'AND "{sla_config["health_plan_field"]}" = "{sla_config["health_plan_value"]}"'
-            f'{self._date_filter_jql()}'
+            f'AND "{sla_config["health_plan_field"]}" = "{sla_config["health_plan_value"]}" '
+            f'ORDER BY created DESC'
         )
 
         self._log(f"[Impact Report SLA] JQL Query: {jql}", "yellow")
 
-        fields = ["key", "created", "summary", "status", "parent", "issuelinks", health_plan_field]
+        # created: SLA start; status: skip canceled; parent: SR whose links lead to the ACS ticket
+        fields = ["created", "status", "parent"]
         subtasks = self.jira.search_issues(jql, fields=fields)
 
         self._log(f"[Impact Report SLA] SR sub-tasks returned: {len(subtasks)}", "green")
 
+        created_dates, elapsed_to_now = self._ticket_dates(subtasks)
+        parent_keys = {(subtask.get("fields", {}).get("parent") or {}).get("key") for subtask in subtasks}
+        parent_links_by_key = self._fetch_issue_links(sorted(key for key in parent_keys if key))
+        acs_keys = set()
+        for links in parent_links_by_key.values():
+            for link in links:
+                linked_issue = link.get("outwardIssue") or link.get("inwardIssue") or {}
+                if linked_issue.get("key", "").startswith(acs_project):
+                    acs_keys.add(linked_issue["key"])
+        comments_by_acs_key = self._fetch_comments_inline(sorted(acs_keys))
+
+        logging_on = self._logging
         for idx, subtask in enumerate(subtasks):
             self._tick(idx + 1, len(subtasks), subtask.get("key", ""))
             subtask_key = subtask.get("key")
             subtask_fields = subtask.get("fields", {})
 
-            self._log(f"\n--- [Impact Report] Processing sub-task {subtask_key} ---", "bold cyan")
+            if logging_on:
+                self._log(f"\n--- [Impact Report] Processing sub-task {subtask_key} ---", "bold cyan")
 
-            subtask_status = (subtask_fields.get("status", {}).get("name") or "").lower()
-            if subtask_status in {"cancelled", "canceled"}:
-                self._log(f"  Skipping {subtask_key}: canceled", "dim")
+            subtask_status = _status_of(subtask)
+            if subtask_status in _CANCELED_STATUSES:
+                if logging_on:
+                    self._log(f"  Skipping {subtask_key}: canceled", "dim")
                 continue
 
-            created_date = parse_jira_date(subtask_fields.get("created"))
+            created_date = created_dates.get(subtask_key)
             if not created_date:
-                self._log(f"  Skipping {subtask_key}: could not parse creation date", "dim")
+                if logging_on:
+                    self._log(f"  Skipping {subtask_key}: could not parse creation date", "dim")
                 continue
 
             # Parent SR ticket — used to find the linked ACS ticket
             parent_key = (subtask_fields.get("parent") or {}).get("key", "")
-            self._log(f"  Parent SR ticket: {parent_key or 'none'}", "dim")
+            if logging_on:
+                self._log(f"  Parent SR ticket: {parent_key or 'none'}", "dim")
 
             report_comment_date = None
             acs_ticket_key = None
 
             if parent_key:
                 try:
-                    parent_data = self.jira.get_issue(parent_key, fields=["issuelinks"])
-                    parent_links = parent_data.get("fields", {}).get("issuelinks", [])
+                    if parent_key in parent_links_by_key:
+                        parent_links = parent_links_by_key[parent_key]
+                    else:
+                        # Sibling sub-tasks share a parent: fetch it at most once
+                        parent_data = self._get_issue_cached(parent_key, ["issuelinks"])
+                        parent_links = parent_data.get("fields", {}).get("issuelinks", [])
 
                     for link in parent_links:
                         linked_issue = link.get("outwardIssue") or link.get("inwardIssue")
@@ -188,11 +592,18 @@ class SLAChecker:
                         if not acs_key.startswith(acs_project):
                             continue
 
-                        self._log(f"  Found ACS ticket linked to SR parent: {acs_key}", "dim")
+                        if logging_on:
+                            self._log(f"  Found ACS ticket linked to SR parent: {acs_key}", "dim")
 
                         try:
-                            comments = self.jira.get_issue_comments(acs_key)
-                            self._log(f"    {len(comments)} comments on {acs_key}", "dim")
+                            if acs_key in comments_by_acs_key:
+                                comments = comments_by_acs_key[acs_key]
+                                if isinstance(comments, Exception):
+                                    raise comments
+                            else:
+                                comments = comments_by_acs_key[acs_key] = self.jira.get_issue_comments(acs_key)
+                            if logging_on:
+                                self._log(f"    {len(comments)} comments on {acs_key}", "dim")
 
                             for comment in comments:
                                 if self._comment_is_impact_report(comment):
@@ -200,7 +611,8 @@ class SLAChecker:
                                     if comment_date and (report_comment_date is None or comment_date < report_comment_date):
                                         report_comment_date = comment_date
                                         acs_ticket_key = acs_key
-                                        self._log(f"    MATCH! Impact report comment on {acs_key} at {comment_date}", "green")
+                                        if logging_on:
+                                            self._log(f"    MATCH! Impact report comment on {acs_key} at {comment_date}", "green")
 
                         except Exception as e:
                             self._log(f"    Error fetching comments for {acs_key}: {e}", "red")
@@ -210,13 +622,14 @@ class SLAChecker:
                     self._log(f"  Error fetching parent SR ticket {parent_key}: {e}", "red")
 
             if report_comment_date:
-                days_elapsed = get_business_days(created_date, report_comment_date)
+                days_elapsed = self._get_business_days(created_date, report_comment_date)
                 status = "met" if days_elapsed <= target_days else "breached"
             else:
-                days_elapsed = get_business_days_elapsed(created_date)
+                days_elapsed = elapsed_to_now[subtask_key]
                 status = "breached" if days_elapsed > target_days else "in_progress"
 
-            self._log(f"  Result: {status} ({days_elapsed} biz days)", "bold")
+            if logging_on:
+                self._log(f"  Result: {status} ({days_elapsed} biz days)", "bold")
 
             result = SLAResult(
                 source_ticket=subtask_key,
@@ -236,54 +649,57 @@ class SLAChecker:
         """
         Check the "Identification of Resolution for Configuration Issues" SLA.
 
-        SLA: Time from ACS ticket creation (for LA Blue health plan) to
-             linked LPM ticket with category "break fix" must be <= 30 business days.
+        SLA: Time from ACS ticket creation (for LA Blue health plan) to a linked
+             LPM ticket reaching "ready for config" must be <= 30 business days.
+             The LPM category is reported, not filtered on.
         """
         sla_config = SLA_DEFINITIONS["identification_resolution_config"]
         summary = SLASummary(
             sla_name=sla_config["name"],
             target_days=sla_config["target_days"],
         )
+        self._now = datetime.now()
 
-        health_plan_field = self.field_ids.get("health_plan", "")
+        health_plan_field = self._health_plan_field
 
         self._log(f"Health plan field ID: {health_plan_field}", "cyan")
-        self._log(f"Category field ID: {self.field_ids.get('category', '')}", "cyan")
+        self._log(f"Category field ID: {self._category_field}", "cyan")
 
-        jql = (
-            f'project = {sla_config["source_project"]} '
-            f'AND "{sla_config["health_plan_field"]}" = "{sla_config["health_plan_value"]}"'
-            f'{self._date_filter_jql()}'
-        )
+        jql = self._source_jqls["identification_resolution_config"]
 
         self._log(f"JQL Query: {jql}", "yellow")
 
-        source_of_id_field = self.field_ids.get("source_of_identification", "")
-        category_field = self.field_ids.get("category", "")
-        fields = ["key", "created", "summary", "status", "issuelinks", health_plan_field, source_of_id_field, category_field]
+        fields = self._source_fields()
         self._log(f"Requesting fields: {fields}", "dim")
 
-        source_tickets = self.jira.search_issues(jql, fields=fields)
+        source_tickets = self._search_issues(jql, fields)
 
         self._log(f"Tickets returned from Jira: {len(source_tickets)}", "green")
 
-        if (self.verbose or self.log_collector is not None) and source_tickets:
+        if self._logging and source_tickets:
             sample = source_tickets[0]
             sample_fields = sample.get('fields', {})
             self._log(f"Sample ticket: {sample.get('key')}  fields={list(sample_fields.keys())}", "dim")
             self._log(f"  Issue links: {len(sample_fields.get('issuelinks', []))}  health_plan={sample_fields.get(health_plan_field)}", "dim")
 
-        excluded_statuses = {"closed", "resolved", "canceled"}
+        changelogs, categories = self._prefetch_linked_issues(
+            source_tickets, sla_config["target_project"], [sla_config["target_status"]]
+        )
+        created_dates, elapsed_to_now = self._ticket_dates(source_tickets)
+        self._transitions = {}
+        self._target_statuses = fold_statuses(sla_config["target_status"])
 
+        logging_on = self._logging
         for idx, ticket in enumerate(source_tickets):
             self._tick(idx + 1, len(source_tickets), ticket.get("key", ""))
-            result = self._evaluate_ticket(ticket, sla_config)
+            if self._skip_unlinked(ticket):
+                continue
+            result = self._evaluate_ticket(ticket, sla_config, changelogs, elapsed_to_now, categories,
+                                           created_dates=created_dates)
+            if self._skip_unlinked(ticket, result):
+                continue
 
-            if not result.target_ticket:
-                ticket_status = (ticket.get("fields", {}).get("status", {}).get("name", "") or "").lower()
-                if ticket_status in excluded_statuses:
-                    self._log(f"  Excluding {result.source_ticket}: no LPM ticket and status is '{ticket_status}'", "dim")
-                    continue
+            if not result.target_ticket and logging_on:
                 self._log(f"  {result.source_ticket}: no LPM ticket reached 'ready for config' yet (tracking as in progress)", "dim")
 
             summary.add_result(result)
@@ -302,35 +718,38 @@ class SLAChecker:
             sla_name=sla_config["name"],
             target_days=sla_config["target_days"],
         )
+        self._now = datetime.now()
 
-        health_plan_field = self.field_ids.get("health_plan", "")
-        source_of_id_field = self.field_ids.get("source_of_identification", "")
-        category_field = self.field_ids.get("category", "")
+        source_of_id_field = self._source_of_id_field
+        category_field = self._category_field
 
-        jql = (
-            f'project = {sla_config["source_project"]} '
-            f'AND "{sla_config["health_plan_field"]}" = "{sla_config["health_plan_value"]}"'
-            f'{self._date_filter_jql()}'
-        )
+        jql = self._source_jqls["resolution_config"]
 
         self._log(f"[Resolution SLA] JQL Query: {jql}", "yellow")
 
-        fields = ["key", "created", "summary", "status", "issuelinks", health_plan_field, source_of_id_field, category_field]
-        source_tickets = self.jira.search_issues(jql, fields=fields)
+        fields = ["created", "status", "issuelinks", source_of_id_field, category_field]
+        source_tickets = self._search_issues(jql, fields)
 
         self._log(f"[Resolution SLA] Tickets returned from Jira: {len(source_tickets)}", "green")
 
-        excluded_statuses = {"closed", "resolved", "canceled"}
+        changelogs, categories = self._prefetch_linked_issues(
+            source_tickets, sla_config["target_project"], sla_config["target_statuses"]
+        )
+        created_dates, elapsed_to_now = self._ticket_dates(source_tickets)
+        self._transitions = {}
+        self._target_statuses = fold_statuses(sla_config["target_statuses"])
 
+        logging_on = self._logging
         for idx, ticket in enumerate(source_tickets):
             self._tick(idx + 1, len(source_tickets), ticket.get("key", ""))
-            result = self._evaluate_ticket_resolution(ticket, sla_config)
+            if self._skip_unlinked(ticket):
+                continue
+            result = self._evaluate_ticket_resolution(ticket, sla_config, changelogs, elapsed_to_now, categories,
+                                                      created_dates=created_dates)
+            if self._skip_unlinked(ticket, result):
+                continue
 
-            if not result.target_ticket:
-                ticket_status = (ticket.get("fields", {}).get("status", {}).get("name", "") or "").lower()
-                if ticket_status in excluded_statuses:
-                    self._log(f"  Excluding {result.source_ticket}: no LPM ticket and status is '{ticket_status}'", "dim")
-                    continue
+            if not result.target_ticket and logging_on:
                 self._log(f"  {result.source_ticket}: no LPM ticket reached a target status yet (tracking as in progress)", "dim")
 
             summary.add_result(result)
@@ -349,46 +768,49 @@ class SLAChecker:
             sla_name=sla_config["name"],
             target_days=sla_config["target_days"],
         )
+        self._now = datetime.now()
 
-        health_plan_field = self.field_ids.get("health_plan", "")
-        source_of_id_field = self.field_ids.get("source_of_identification", "")
-        category_field = self.field_ids.get("category", "")
+        source_of_id_field = self._source_of_id_field
+        category_field = self._category_field
 
-        jql = (
-            f'project = {sla_config["source_project"]} '
-            f'AND "{sla_config["health_plan_field"]}" = "{sla_config["health_plan_value"]}"'
-            f'{self._date_filter_jql()}'
-        )
+        jql = self._source_jqls["first_response"]
 
         self._log(f"[First Response SLA] JQL Query: {jql}", "yellow")
 
-        fields = ["key", "created", "summary", "status", health_plan_field, source_of_id_field, category_field]
-        source_tickets = self.jira.search_issues(jql, fields=fields)
+        # No status or links here: the SLA only needs the creation date and the comments,
+        # which come back inline with the search
+        fields = ["created", "comment", source_of_id_field, category_field]
+        source_tickets = self._search_issues(jql, fields)
 
         self._log(f"[First Response SLA] Tickets returned from Jira: {len(source_tickets)}", "green")
 
+        created_dates, elapsed_to_now = self._ticket_dates(source_tickets)
+        comments_by_key = self._inline_comments(source_tickets)
+        target_days = sla_config["target_days"]
+        logging_on = self._logging
+
         for idx, ticket in enumerate(source_tickets):
             self._tick(idx + 1, len(source_tickets), ticket.get("key", ""))
             ticket_key = ticket.get("key")
             ticket_fields = ticket.get("fields", {})
 
-            self._log(f"\n--- [First Response] Evaluating {ticket_key} ---", "bold cyan")
+            if logging_on:
+                self._log(f"\n--- [First Response] Evaluating {ticket_key} ---", "bold cyan")
 
-            created_str = ticket_fields.get("created")
-            created_date = parse_jira_date(created_str)
-            if not created_date:
-                created_date = datetime.now()
+            created_date = created_dates.get(ticket_key) or self._now
 
-            try:
-                comments = self.jira.get_issue_comments(ticket_key)
-            except Exception as e:
-                self._log(f"  Error fetching comments: {e}", "red")
+            comments = comments_by_key.get(ticket_key, [])
+            if isinstance(comments, Exception):
+                self._log(f"  Error fetching comments: {comments}", "red")
                 comments = []
 
-            self._log(f"  Total comments: {len(comments)}", "dim")
+            if logging_on:
+                self._log(f"  Total comments: {len(comments)}", "dim")
 
+            # Jira returns comments oldest first, with every timestamp in one offset, so the
+            # string sort is a cheap safeguard and the first public comment is the earliest
             first_response_date = None
-            for comment in comments:
+            for comment in sorted(comments, key=lambda c: c.get("created") or ""):
                 jsd_public = comment.get("jsdPublic")
                 visibility = comment.get("visibility")
 
@@ -399,29 +821,31 @@ class SLAChecker:
                     continue
 
                 comment_date = parse_jira_date(comment.get("created"))
-                if comment_date and (first_response_date is None or comment_date < first_response_date):
+                if comment_date:
                     first_response_date = comment_date
-                    author = comment.get("author", {})
-                    self._log(f"  Public comment found: {author.get('displayName', 'Unknown')} on {comment_date}", "green")
+                    if logging_on:
+                        author = comment.get("author", {})
+                        self._log(f"  Public comment found: {author.get('displayName', 'Unknown')} on {comment_date}", "green")
+                    break
 
-            source_of_id = extract_field_value(ticket_fields.get(SOURCE_OF_ID_FIELD_ID), default="")
-            category_migrated = extract_field_value(ticket_fields.get(CATEGORY_FIELD_ID), default="")
+            source_of_id = extract_field_value(ticket_fields.get(source_of_id_field), default="")
+            category_migrated = extract_field_value(ticket_fields.get(category_field), default="")
 
             if first_response_date:
-                days_elapsed = get_business_days(created_date, first_response_date)
+                days_elapsed = self._get_business_days(created_date, first_response_date)
                 elapsed_time_str = format_elapsed_time(created_date, first_response_date)
             else:
-                days_elapsed = get_business_days_elapsed(created_date)
-                elapsed_time_str = format_elapsed_time(created_date, datetime.now())
-
-            target_days = sla_config["target_days"]
+                # Tickets without a parseable created date fall back to now, i.e. 0 days
+                days_elapsed = elapsed_to_now.get(ticket_key, 0)
+                elapsed_time_str = format_elapsed_time(created_date, self._now)
 
             if first_response_date:
                 status = "met" if days_elapsed <= target_days else "breached"
             else:
                 status = "breached" if days_elapsed > target_days else "in_progress"
 
-            self._log(f"  Result: {status} ({days_elapsed} biz days, {elapsed_time_str})", "bold")
+            if logging_on:
+                self._log(f"  Result: {status} ({days_elapsed} biz days, {elapsed_time_str})", "bold")
 
             result = SLAResult(
                 source_ticket=ticket_key,
@@ -448,7 +872,6 @@ class SLAChecker:
         and all linked ticket keys for visibility.
         """
         sla_config = SLA_DEFINITIONS["impact_report_delivery"]
-        health_plan_field = self.field_ids.get("health_plan", "")
 
         jql = (
             f'project = {sla_config["lpm_project"]} '
@@ -458,19 +881,16 @@ class SLAChecker:
 
         self._log(f"[Fix Versions] JQL: {jql}", "yellow")
 
-        fields = ["key", "summary", "status", "fixVersions", "issuelinks", health_plan_field]
-        tickets = self.jira.search_issues(jql, fields=fields)
-
-        self._log(f"[Fix Versions] Tickets with fixVersions: {len(tickets)}", "green")
-
-        if not tickets:
-            return []
+        fields = ["summary", "status", "fixVersions", "issuelinks"]
 
         # Collect unique non-archived versions and their tickets
         versions = {}        # version_id -> version dict
         version_tickets = {}  # version_id -> list of ticket dicts
 
-        for ticket in tickets:
+        # Tickets are consumed as the search streams in; only the summaries are kept
+        ticket_count = 0
+        for ticket in self.jira.iter_issues(jql, fields=fields):
+            ticket_count += 1
             ticket_fields = ticket.get("fields", {})
             fix_versions = ticket_fields.get("fixVersions", [])
 
@@ -502,6 +922,8 @@ class SLAChecker:
 
                 version_tickets[version_id].append(ticket_entry)
 
+        self._log(f"[Fix Versions] Tickets with fixVersions: {ticket_count}", "green")
+
         if not versions:
             return []
 
@@ -543,25 +965,40 @@ class SLAChecker:
             for v in final_versions
         ]
 
-    def _evaluate_ticket_resolution(self, ticket: dict, sla_config: dict) -> SLAResult:
+    def _evaluate_ticket_resolution(self, ticket: dict, sla_config: dict, changelogs: dict = None,
+                                    elapsed_to_now: dict = None, categories: dict = None,
+                                    created_dates: dict = None) -> SLAResult:
         """Evaluate a single ACS ticket against the Resolution SLA.
 
         Stops when a linked LPM ticket first transitions to any of target_statuses.
+        changelogs and categories map LPM keys to prefetched changelog histories and
+        category values; elapsed_to_now and created_dates hold the check's batch-computed
+        business days to now and parsed creation dates (see _created_dates).
         """
+        changelogs = changelogs or {}
+        categories = categories or {}
+        logging_on = self._logging
         ticket_key = ticket.get("key")
         fields = ticket.get("fields", {})
 
-        self._log(f"\n--- [Resolution] Evaluating {ticket_key} ---", "bold cyan")
+        if logging_on:
+            self._log(f"\n--- [Resolution] Evaluating {ticket_key} ---", "bold cyan")
 
-        created_str = fields.get("created")
-        created_date = parse_jira_date(created_str) or datetime.now()
+        if created_dates is not None:
+            created_date = created_dates.get(ticket_key) or self._now
+        else:
+            created_date = parse_jira_date(fields.get("created")) or self._now
 
         issue_links = fields.get("issuelinks", [])
         target_ticket = None
         resolved_date = None
         candidates = []
 
-        target_statuses = sla_config.get("target_statuses", [])
+        # Loop invariants bound once, not looked up per link
+        target_statuses = self._target_statuses
+        target_project = sla_config["target_project"]
+        transition_date_of = self.jira.get_status_transition_date
+        transitions = self._transitions
 
         for link in issue_links:
             linked_issue = link.get("outwardIssue") or link.get("inwardIssue")
@@ -569,51 +1006,64 @@ class SLAChecker:
                 continue
 
             linked_key = linked_issue.get("key", "")
-            if not linked_key.startswith(sla_config["target_project"]):
+            if not linked_key.startswith(target_project):
                 continue
 
-            linked_status = (linked_issue.get("fields", {}).get("status", {}).get("name") or "").lower()
-            if linked_status in {"cancelled", "canceled"}:
-                self._log(f"    Skipping {linked_key}: LPM ticket is canceled", "dim")
+            linked_status = _status_of(linked_issue)
+            if linked_status in _CANCELED_STATUSES:
+                if logging_on:
+                    self._log(f"    Skipping {linked_key}: LPM ticket is canceled", "dim")
                 continue
 
-            self._log(f"    Checking LPM {linked_key} for target statuses...", "dim")
+            if logging_on:
+                self._log(f"    Checking LPM {linked_key} for target statuses...", "dim")
 
             try:
-                transition_date_str = self.jira.get_status_transition_date(linked_key, target_statuses)
+                if linked_key in transitions:
+                    transition_date_str = transitions[linked_key]
+                else:
+                    transition_date_str = transitions[linked_key] = transition_date_of(
+                        linked_key, target_statuses, changelog=changelogs.get(linked_key)
+                    )
                 if transition_date_str:
                     transition_date = parse_jira_date(transition_date_str)
-                    candidates.append((linked_key, transition_date))
-                    self._log(f"      MATCH! {linked_key} reached a target status on {transition_date}", "green")
-                else:
+                    candidates.append(LinkCandidate(linked_key, transition_date))
+                    if logging_on:
+                        self._log(f"      MATCH! {linked_key} reached a target status on {transition_date}", "green")
+                elif logging_on:
                     self._log(f"      No target status transition found", "dim")
             except Exception as e:
                 self._log(f"      Error fetching changelog for {linked_key}: {e}", "red")
                 continue
 
         if candidates:
-            candidates.sort(key=lambda c: c[1] or datetime.min, reverse=True)
-            target_ticket, resolved_date = candidates[0]
-            self._log(f"  Selected LPM ticket: {target_ticket}", "green")
+            target_ticket, resolved_date = self._pick_candidate(candidates)
+            if logging_on:
+                self._log(f"  Selected LPM ticket: {target_ticket}", "green")
 
-        source_of_id = extract_field_value(fields.get(SOURCE_OF_ID_FIELD_ID), default="")
-        category_migrated = extract_field_value(fields.get(CATEGORY_FIELD_ID), default="")
+        source_of_id = extract_field_value(fields.get(self._source_of_id_field), default="")
+        category_migrated = extract_field_value(fields.get(self._category_field), default="")
 
-        # Fetch LPM category for the winning ticket
+        # LPM category for the winning ticket, fetched only if the prefetch missed it
         target_category = ""
-        cat_field = self.field_ids.get("category", "")
-        if target_ticket and cat_field:
+        cat_field = self._category_field
+        if target_ticket in categories:
+            target_category = categories[target_ticket]
+        elif target_ticket and cat_field:
             try:
-                lpm_data = self.jira.get_issue(target_ticket, fields=[cat_field])
+                lpm_data = self._get_issue_cached(target_ticket, [cat_field], max_age=_LPM_CATEGORY_MAX_AGE)
                 target_category = extract_field_value(lpm_data.get("fields", {}).get(cat_field), default="")
-                self._log(f"  LPM category for {target_ticket}: {target_category}", "dim")
+                if logging_on:
+                    self._log(f"  LPM category for {target_ticket}: {target_category}", "dim")
             except Exception as e:
                 self._log(f"  Could not fetch LPM category for {target_ticket}: {e}", "dim")
 
         if resolved_date:
-            days_elapsed = get_business_days(created_date, resolved_date)
+            days_elapsed = self._get_business_days(created_date, resolved_date)
+        elif elapsed_to_now and ticket_key in elapsed_to_now:
+            days_elapsed = elapsed_to_now[ticket_key]
         else:
-            days_elapsed = get_business_days_elapsed(created_date)
+            days_elapsed = get_business_days_elapsed(created_date, self._now)
 
         target_days = sla_config["target_days"]
 
@@ -622,7 +1072,8 @@ class SLAChecker:
         else:
             status = "breached" if days_elapsed > target_days else "in_progress"
 
-        self._log(f"  Result: {status} ({days_elapsed} days)", "bold")
+        if logging_on:
+            self._log(f"  Result: {status} ({days_elapsed} days)", "bold")
 
         return SLAResult(
             source_ticket=ticket_key,
@@ -638,79 +1089,112 @@ class SLAChecker:
             target_category=target_category,
         )
 
-    def _evaluate_ticket(self, ticket: dict, sla_config: dict) -> SLAResult:
+    def _evaluate_ticket(self, ticket: dict, sla_config: dict, changelogs: dict = None,
+                         elapsed_to_now: dict = None, categories: dict = None,
+                         created_dates: dict = None) -> SLAResult:
         """Evaluate a single ACS ticket against the Identification SLA.
 
         Stops when a linked LPM ticket first transitions to target_status.
+        changelogs and categories map LPM keys to prefetched changelog histories and
+        category values; elapsed_to_now and created_dates hold the check's batch-computed
+        business days to now and parsed creation dates (see _created_dates).
         """
+        changelogs = changelogs or {}
+        categories = categories or {}
+        logging_on = self._logging
         ticket_key = ticket.get("key")
         fields = ticket.get("fields", {})
 
-        self._log(f"\n--- Evaluating {ticket_key} ---", "bold cyan")
+        if logging_on:
+            self._log(f"\n--- Evaluating {ticket_key} ---", "bold cyan")
 
-        created_str = fields.get("created")
-        created_date = parse_jira_date(created_str) or datetime.now()
+        if created_dates is not None:
+            created_date = created_dates.get(ticket_key) or self._now
+        else:
+            created_date = parse_jira_date(fields.get("created")) or self._now
 
-        self._log(f"  Created: {created_date}", "dim")
+        if logging_on:
+            self._log(f"  Created: {created_date}", "dim")
 
         issue_links = fields.get("issuelinks", [])
-        self._log(f"  Issue links found: {len(issue_links)}", "dim")
+        if logging_on:
+            self._log(f"  Issue links found: {len(issue_links)}", "dim")
 
         target_ticket = None
         resolved_date = None
         candidates = []
 
+        # Loop invariants bound once, not looked up per link
+        target_status = sla_config["target_status"]
+        target_statuses = self._target_statuses
+        target_project = sla_config["target_project"]
+        transition_date_of = self.jira.get_status_transition_date
+        transitions = self._transitions
+
         for link in issue_links:
             linked_issue = link.get("outwardIssue") or link.get("inwardIssue")
             if not linked_issue:
                 continue
 
             linked_key = linked_issue.get("key", "")
-            if not linked_key.startswith(sla_config["target_project"]):
+            if not linked_key.startswith(target_project):
                 continue
 
-            linked_status = (linked_issue.get("fields", {}).get("status", {}).get("name") or "").lower()
-            if linked_status in {"cancelled", "canceled"}:
-                self._log(f"    Skipping {linked_key}: LPM ticket is canceled", "dim")
+            linked_status = _status_of(linked_issue)
+            if linked_status in _CANCELED_STATUSES:
+                if logging_on:
+                    self._log(f"    Skipping {linked_key}: LPM ticket is canceled", "dim")
                 continue
 
-            self._log(f"    Checking LPM {linked_key} for '{sla_config['target_status']}' status...", "dim")
+            if logging_on:
+                self._log(f"    Checking LPM {linked_key} for '{target_status}' status...", "dim")
 
             try:
-                transition_date_str = self.jira.get_status_transition_date(linked_key, sla_config["target_status"])
+                if linked_key in transitions:
+                    transition_date_str = transitions[linked_key]
+                else:
+                    transition_date_str = transitions[linked_key] = transition_date_of(
+                        linked_key, target_statuses, changelog=changelogs.get(linked_key)
+                    )
                 if transition_date_str:
                     transition_date = parse_jira_date(transition_date_str)
-                    candidates.append((linked_key, transition_date))
-                    self._log(f"      MATCH! {linked_key} reached '{sla_config['target_status']}' on {transition_date}", "green")
-                else:
-                    self._log(f"      No '{sla_config['target_status']}' transition found", "dim")
+                    candidates.append(LinkCandidate(linked_key, transition_date))
+                    if logging_on:
+                        self._log(f"      MATCH! {linked_key} reached '{target_status}' on {transition_date}", "green")
+                elif logging_on:
+                    self._log(f"      No '{target_status}' transition found", "dim")
             except Exception as e:
                 self._log(f"      Error fetching changelog for {linked_key}: {e}", "red")
                 continue
 
         if candidates:
-            candidates.sort(key=lambda c: c[1] or datetime.min, reverse=True)
-            target_ticket, resolved_date = candidates[0]
-            self._log(f"  Selected LPM ticket: {target_ticket}", "green")
+            target_ticket, resolved_date = self._pick_candidate(candidates)
+            if logging_on:
+                self._log(f"  Selected LPM ticket: {target_ticket}", "green")
 
-        source_of_id = extract_field_value(fields.get(SOURCE_OF_ID_FIELD_ID), default="")
-        category_migrated = extract_field_value(fields.get(CATEGORY_FIELD_ID), default="")
+        source_of_id = extract_field_value(fields.get(self._source_of_id_field), default="")
+        category_migrated = extract_field_value(fields.get(self._category_field), default="")
 
-        # Fetch LPM category for the winning ticket
+        # LPM category for the winning ticket, fetched only if the prefetch missed it
         target_category = ""
-        cat_field = self.field_ids.get("category", "")
-        if target_ticket and cat_field:
+        cat_field = self._category_field
+        if target_ticket in categories:
+            target_category = categories[target_ticket]
+        elif target_ticket and cat_field:
             try:
-                lpm_data = self.jira.get_issue(target_ticket, fields=[cat_field])
+                lpm_data = self._get_issue_cached(target_ticket, [cat_field], max_age=_LPM_CATEGORY_MAX_AGE)
                 target_category = extract_field_value(lpm_data.get("fields", {}).get(cat_field), default="")
-                self._log(f"  LPM category for {target_ticket}: {target_category}", "dim")
+                if logging_on:
+                    self._log(f"  LPM category for {target_ticket}: {target_category}", "dim")
             except Exception as e:
                 self._log(f"  Could not fetch LPM category for {target_ticket}: {e}", "dim")
 
         if resolved_date:
-            days_elapsed = get_business_days(created_date, resolved_date)
+            days_elapsed = self._get_business_days(created_date, resolved_date)
+        elif elapsed_to_now and ticket_key in elapsed_to_now:
+            days_elapsed = elapsed_to_now[ticket_key]
         else:
-            days_elapsed = get_business_days_elapsed(created_date)
+            days_elapsed = get_business_days_elapsed(created_date, self._now)
 
         target_days = sla_config["target_days"]
 
@@ -725,7 +1209,8 @@ class SLAChecker:
             else:
                 status = "in_progress"
 
-        self._log(f"  Result: {status} ({days_elapsed} days)", "bold")
+        if logging_on:
+            self._log(f"  Result: {status} ({days_elapsed} days)", "bold")
 
         return SLAResult(
             source_ticket=ticket_key,
@@ -59,9 +59,9 @@ except ImportError:
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from config import JIRA_FIELDS
+from config import FIELDS_CACHE_FILE
 from jira_client import JiraClient
-from sla_checker import SLAChecker
+from sla_checker import SLAChecker, resolve_field_ids
 from sla_calculator import SLASummary, SLAResult, get_business_days, get_business_days_elapsed
 
 # Credentials from environment variables (all three required to skip the sidebar form)
@@ -546,7 +546,8 @@ def display_sla_section(summary: SLASummary, sla_num: int, title: str, caption:
             with st.expander(f"🔗 Override linked LPM ticket ({len(multi)} ticket{'s' if len(multi) != 1 else ''} with multiple candidates)"):
                 st.caption("The calculator auto-selects the most recent LPM transition. Pick a different one here — takes effect immediately.")
                 for r in multi:
-                    cand_keys = [k for k, _ in r.lpm_candidates]
+                    # Most recent transition first, so the default is the calculator's own pick
+                    cand_keys = [k for k, _ in sorted(r.lpm_candidates, key=lambda c: c[1] or datetime.min, reverse=True)]
                     current = st.session_state.lpm_overrides.get(r.source_ticket, cand_keys[0])
                     if current not in cand_keys:
                         current = cand_keys[0]
@@ -824,8 +825,20 @@ if run_btn:
         date_from=date_from_str, date_to=date_to_str,
         progress_callback=_make_callback(1, 0, _s1),
     )
-    checker.set_field_id("health_plan", JIRA_FIELDS["health_plan"])
-    checker.set_field_id("category",    JIRA_FIELDS["category"])
+    # Same name-based field lookup as the CLI, so both query the same fields
+    for field_name, field_id in resolve_field_ids(client, cache_file=FIELDS_CACHE_FILE).items():
+        checker.set_field_id(field_name, field_id)
+    try:
+        # SLAs 1–3 read the same ACS tickets: fetch them once for all three
+        checker.prefetch_source_tickets()
+    except Exception as e:
+        # Each check retries the search itself and reports its own error; record why the
+        # shared fetch failed so the extra round trips (or a later failure) are explained
+        log_collector.append({
+            "level": "warning",
+            "message": f"Prefetching the shared ACS tickets failed ({e}) — each SLA check will search on its own",
+            "time": datetime.now().strftime("%H:%M:%S"),
+        })
     try:
         _section("SLA 1 — Time to First Response")
         summaries[0] = checker.check_first_response()
@@ -1040,6 +1053,7 @@ with tab_dashboard:
 with tab_log:
     _LEVEL_STYLE = {
         "error":   {"border": "#dc2626", "bg": "#fee2e2", "badge_bg": "#dc2626", "badge_fg": "#ffffff", "label": "ERROR"},
+        "warning": {"border": "#d97706", "bg": "#fef3c7", "badge_bg": "#d97706", "badge_fg": "#ffffff", "label": "WARN"},
         "success": {"border": "#16a34a", "bg": "#dcfce7", "badge_bg": "#16a34a", "badge_fg": "#ffffff", "label": "OK"},
         "info":    {"border": "#2563eb", "bg": "#dbeafe", "badge_bg": "#2563eb", "badge_fg": "#ffffff", "label": "INFO"},
         "detail":  {"border": "#cbd5e1", "bg": "#f8fafc", "badge_bg": "#94a3b8", "badge_fg": "#ffffff", "label": "DETAIL"},
@@ -1085,10 +1099,10 @@ with tab_log:
         )
         level_filter = st.multiselect(
             "Filter by level",
-            options=["INFO", "OK", "DETAIL", "ERROR"],
-            default=["INFO", "OK", "DETAIL", "ERROR"],
+            options=["INFO", "OK", "DETAIL", "WARN", "ERROR"],
+            default=["INFO", "OK", "DETAIL", "WARN", "ERROR"],
         )
-        level_map      = {"INFO": "info", "OK": "success", "DETAIL": "detail", "ERROR": "error"}
+        level_map      = {"INFO": "info", "OK": "success", "DETAIL": "detail", "WARN": "warning", "ERROR": "error"}
         selected_levels = {level_map[l] for l in level_filter}
 
         # ── Group entries: section markers → SLA groups, ticket headers → ticket groups ──